@@ -1265,7 +1265,6 @@ class SummaPreProcessor_spatial:
             ValueError: If there are inconsistencies between the cold state and forcing data.
         """
         self.logger.info("Creating initial conditions (cold state) file")
-        self.logger.info("Creating initial conditions (cold state) file")
 
         # Find a forcing file to use as a template for hruId order
         forcing_files = list(self.forcing_summa_path.glob('*.nc'))
@@ -111,12 +111,13 @@ class SummaPreProcessor:
 
 import os
 import sys
+import logging
 from shutil import rmtree, copyfile
-import glob
 import easymore # type: ignore
 import numpy as np # type: ignore
 import pandas as pd # type: ignore
 import xarray as xr # type: ignore
+import dask # type: ignore
 import geopandas as gpd # type: ignore
 import netCDF4 as nc4 # type: ignore
 from pathlib import Path
@@ -129,12 +130,19 @@ from shapely.geometry import Polygon, box, Point, LineString, MultiLineString, G
 import time
 import tempfile
 import shutil
+import hashlib
+import multiprocessing
+import json
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from itertools import repeat
 import rasterio # type: ignore
 from pyproj import Transformer # type: ignore
 import pyproj # type: ignore
 import shapefile # type: ignore
 from skimage import measure # type: ignore
 from rasterio import features # type: ignore
+from rasterio.windows import Window, WindowError, from_bounds, bounds as window_bounds, transform as window_transform # type: ignore
+from pyarrow import csv as pacsv # type: ignore
 
 class SummaPreProcessor_spatial:
     def __init__(self, config: Dict[str, Any], logger: Any):
@@ -169,6 +177,7 @@ class SummaPreProcessor_spatial:
             parameter_name (str): Name of the trial parameters file.
             attribute_name (str): Name of the attributes file.
             forcing_measurement_height (float): Measurement height for forcing data.
+            max_fail_streak (int): Consecutive forcing file failures tolerated before aborting.
 
         """
 
@@ -190,6 +199,7 @@ class SummaPreProcessor_spatial:
         self.forcing_basin_path.mkdir(parents=True, exist_ok=True)
 
         self.forcing_summa_path = self.project_dir / 'forcing' / 'SUMMA_input'
+        self._forcing_hru_ids = None  # set by _forcing_hruIds once a forcing file has been read
         self.catchment_path = self._get_default_path('CATCHMENT_PATH', 'shapefiles/catchment')
         self.river_network_name = self.config.get('RIVER_NETWORK_SHP_NAME')
         if self.river_network_name == 'default':
@@ -209,6 +219,7 @@ class SummaPreProcessor_spatial:
         self.forcing_measurement_height = float(self.config.get('FORCING_MEASUREMENT_HEIGHT'))
         self.merged_forcing_path = self._get_default_path('FORCING_PATH', 'forcing/merged_data')
         self.intersect_path = self.project_dir / 'shapefiles' / 'catchment_intersection' / 'with_forcing'
+        self.max_fail_streak = 5
 
 
 
@@ -731,12 +742,15 @@ class SummaPreProcessor_spatial:
         remap_file = f"{esmr.case_name}_remapping.csv"
         self.intersect_path = self.project_dir / 'shapefiles' / 'catchment_intersection' / 'with_forcing'
         self.intersect_path.mkdir(parents=True, exist_ok=True)
-        copyfile(os.path.join(esmr.temp_dir, remap_file), self.intersect_path / remap_file)
-
-        for file in glob.glob(os.path.join(esmr.temp_dir, f"{esmr.case_name}_intersected_shapefile.*")):
-            copyfile(file, self.intersect_path / os.path.basename(file))
+        temp_dir = Path(esmr.temp_dir)
+        for src in [temp_dir / remap_file, *temp_dir.glob(f"{esmr.case_name}_intersected_shapefile.*")]:
+            dst = self.intersect_path / src.name
+            try:
+                os.replace(src, dst)  # rename on the same filesystem, no data copy
+            except OSError:
+                shutil.move(str(src), str(dst))
 
-        # Remove temporary directory
+        # Remove temporary directory (still holds EASYMORE's other intermediate files)
         rmtree(esmr.temp_dir, ignore_errors=True)
 
         self.logger.info("One weighted forcing file created")
@@ -782,14 +796,20 @@ class SummaPreProcessor_spatial:
         esmr.sort_ID = False
         esmr.overwrite_existing_remap = overwrite
 
-        # Process remaining forcing files
+        # Process remaining forcing files, giving up if several files in a row fail
         forcing_files = sorted([f for f in forcing_path.glob('*.nc')])
+        fail_streak = 0
         for file in forcing_files[1:]:
             try:
                 esmr.source_nc = str(file)
                 esmr.nc_remapper()
-            except:
-                self.logger.info(f'issue with file: {file}')
+                fail_streak = 0
+            except (OSError, RuntimeError, KeyError) as e:
+                fail_streak += 1
+                self.logger.warning(f'Issue with file {file}: {str(e)}')
+                if fail_streak > self.max_fail_streak:
+                    self.logger.error(f"{fail_streak} consecutive forcing files failed to remap, aborting")
+                    raise
 
         self.logger.info("All weighted forcing files created")
 
@@ -814,8 +834,11 @@ class SummaPreProcessor_spatial:
         """
         self.logger.info("Starting to apply temperature lapse rate and add data step")
 
+        forcing_dataset = self.config.get('FORCING_DATASET')
+        apply_lapse_rate = self.config.get('APPLY_LAPSE_RATE') == True
+
         # Find intersection file
-        intersect_base = f"{self.domain_name}_{self.config.get('FORCING_DATASET')}_intersected_shapefile"
+        intersect_base = f"{self.domain_name}_{forcing_dataset}_intersected_shapefile"
         intersect_csv = self.intersect_path / f"{intersect_base}.csv"
         intersect_shp = self.intersect_path / f"{intersect_base}.shp"
 
@@ -833,19 +856,12 @@ class SummaPreProcessor_spatial:
         elif not intersect_csv.exists() and not intersect_shp.exists():
             raise FileNotFoundError(f"Neither {intersect_csv} nor {intersect_shp} exist")
 
-        # Continue with existing code using the CSV file
-        topo_data = pd.read_csv(intersect_csv)
-
         # Get forcing files
-        forcing_files = [f for f in os.listdir(self.forcing_basin_path) if f.startswith(f"{self.domain_name}_{self.config.get('FORCING_DATASET')}") and f.endswith('.nc')]
-        forcing_files.sort()
+        forcing_files = self._list_forcing_files(self.forcing_basin_path, f"{self.domain_name}_{forcing_dataset}")
 
         # Prepare output directory
         self.forcing_summa_path.mkdir(parents=True, exist_ok=True)
 
-        # Load area-weighted information for each basin
-        #topo_data = pd.read_csv(self.intersect_path / intersect_name)
-
         # Specify column names
         gru_id = f'S_1_{self.gruId}'
         hru_id = f'S_1_{self.hruId}'
@@ -856,19 +872,40 @@ class SummaPreProcessor_spatial:
 
         # Define lapse rate
         lapse_rate = float(self.config.get('LAPSE_RATE'))  # [K m-1]
-        # Calculate weighted lapse values for each HRU
-        topo_data['lapse_values'] = topo_data[weights] * lapse_rate * (topo_data[forcing_elev] - topo_data[catchment_elev])
 
-        # Find total lapse value per basin
-        if gru_id == hru_id:
-            lapse_values = topo_data.groupby([hru_id]).lapse_values.sum().reset_index()
+        # Reuse the per-HRU lapse values from a previous run if the intersection, its columns and the lapse rate are unchanged
+        key_hash = hashlib.md5()
+        with open(intersect_csv, 'rb') as f:
+            for block in iter(lambda: f.read(1 << 20), b''):
+                key_hash.update(block)
+        key_hash.update(json.dumps([gru_id, hru_id, forcing_id, catchment_elev, forcing_elev, weights, lapse_rate]).encode())
+        cache_key = key_hash.hexdigest()
+        lapse_cache = self.project_dir / 'cache' / f"lapse_{cache_key}.parquet"
+        if lapse_cache.exists():
+            self.logger.info(f"Loading cached lapse values from {lapse_cache}")
+            lapse_values = pd.read_parquet(lapse_cache)
         else:
-            lapse_values = topo_data.groupby([gru_id, hru_id]).lapse_values.sum().reset_index()
+            # Load area-weighted information for each basin, reading only the columns we need
+            columns = list(dict.fromkeys([gru_id, hru_id, forcing_id, catchment_elev, forcing_elev, weights]))
+            table = pacsv.read_csv(intersect_csv, convert_options=pacsv.ConvertOptions(include_columns=columns))
+            topo_data = table.to_pandas()
 
-        # Sort and set hruID as the index variable
-        lapse_values = lapse_values.sort_values(hru_id).set_index(hru_id)
+            # Calculate weighted lapse values for each HRU
+            topo_data['lapse_values'] = topo_data[weights] * lapse_rate * (topo_data[forcing_elev] - topo_data[catchment_elev])
 
-        # Process each forcing file
+            # Find total lapse value per basin
+            if gru_id == hru_id:
+                lapse_values = topo_data.groupby([hru_id]).lapse_values.sum().reset_index()
+            else:
+                lapse_values = topo_data.groupby([gru_id, hru_id]).lapse_values.sum().reset_index()
+
+            # Sort and set hruID as the index variable
+            lapse_values = lapse_values.sort_values(hru_id).set_index(hru_id)
+            lapse_cache.parent.mkdir(parents=True, exist_ok=True)
+            lapse_values.to_parquet(lapse_cache)
+
+        # Process each forcing file, giving up if several files in a row fail
+        fail_streak = 0
         for file in forcing_files:
             self.logger.info(f"Processing {file}")
             try: 
@@ -887,7 +924,7 @@ class SummaPreProcessor_spatial:
                     dat.data_step.attrs['long_name'] = 'data step length in seconds'
                     dat.data_step.attrs['units'] = 's'
 
-                    if self.config.get('APPLY_LAPSE_RATE') == True:
+                    if apply_lapse_rate:
                         # Get air temperature attributes
                         tmp_units = dat['airtemp'].units
                         
@@ -897,8 +934,13 @@ class SummaPreProcessor_spatial:
 
                     # Save to file in new location
                     dat.to_netcdf(output_file)
-            except:
-                self.logger.warning(f'Issue with file:{file}')
+                fail_streak = 0
+            except (OSError, RuntimeError, KeyError) as e:
+                fail_streak += 1
+                self.logger.warning(f'Issue with file {file}: {str(e)}')
+                if fail_streak > self.max_fail_streak:
+                    self.logger.error(f"{fail_streak} consecutive forcing files failed, aborting")
+                    raise
 
         self.logger.info(f"Completed processing of {self.forcing_dataset.upper()} forcing files with temperature lapsing")
 
@@ -919,10 +961,12 @@ class SummaPreProcessor_spatial:
             ValueError: If there are issues with data extraction or processing.
             IOError: If there are issues writing the shapefile.
         """
-        
-        
+        forcing_dataset = self.config.get('FORCING_DATASET')
+        lat_name = self.config.get('FORCING_SHAPE_LAT_NAME')
+        lon_name = self.config.get('FORCING_SHAPE_LON_NAME')
+        output_shapefile = self.shapefile_path / f"forcing_{forcing_dataset}.shp"
 
-        if self.config.get('FORCING_DATASET') == 'RDRS':
+        if forcing_dataset == 'RDRS':
             self.logger.info("Starting to create RDRS shapefile")
 
             # Find the first monthly file
@@ -972,27 +1016,23 @@ class SummaPreProcessor_spatial:
             gdf = gpd.GeoDataFrame({
                 'geometry': geometries,
                 'ID': ids,
-                self.config.get('FORCING_SHAPE_LAT_NAME'): lats,
-                self.config.get('FORCING_SHAPE_LON_NAME'): lons,
+                lat_name: lats,
+                lon_name: lons,
             }, crs='EPSG:4326')
 
             # Calculate zonal statistics (mean elevation) for each grid cell
-            zs = rasterstats.zonal_stats(gdf, str(self.dem_path), stats=['mean'])
-
-            # Add mean elevation to the GeoDataFrame
-            gdf['elev_m'] = [item['mean'] for item in zs]
+            gdf['elev_m'] = self._dem_mean(gdf)
 
             # Drop columns that are on the edge and don't have elevation data
             gdf.dropna(subset=['elev_m'], inplace=True)
 
             # Save the shapefile
             self.shapefile_path.mkdir(parents=True, exist_ok=True)
-            output_shapefile = self.shapefile_path / f"forcing_{self.config['FORCING_DATASET']}.shp"
             gdf.to_file(output_shapefile)
 
             self.logger.info(f"RDRS shapefile created and saved to {output_shapefile}")
 
-        elif self.config.get('FORCING_DATASET') == 'ERA5':
+        elif forcing_dataset == 'ERA5':
             self.logger.info("Creating ERA5 shapefile")
 
             # Find an .nc file in the forcing path
@@ -1038,27 +1078,23 @@ class SummaPreProcessor_spatial:
             gdf = gpd.GeoDataFrame({
                 'geometry': geometries,
                 'ID': ids,
-                self.config.get('FORCING_SHAPE_LAT_NAME'): lats,
-                self.config.get('FORCING_SHAPE_LON_NAME'): lons,
+                lat_name: lats,
+                lon_name: lons,
             }, crs='EPSG:4326')
 
             # Calculate zonal statistics (mean elevation) for each grid cell
-            zs = rasterstats.zonal_stats(gdf, str(self.dem_path), stats=['mean'])
-
-            # Add mean elevation to the GeoDataFrame
-            gdf['elev_m'] = [item['mean'] for item in zs]
+            gdf['elev_m'] = self._dem_mean(gdf)
 
             # Drop columns that are on the edge and don't have elevation data
             gdf.dropna(subset=['elev_m'], inplace=True)
 
             # Save the shapefile
             self.shapefile_path.mkdir(parents=True, exist_ok=True)
-            output_shapefile = self.shapefile_path / f"forcing_{self.config['FORCING_DATASET']}.shp"
             gdf.to_file(output_shapefile)
 
             self.logger.info(f"ERA5 shapefile created and saved to {output_shapefile}")
 
-        elif self.config.get('FORCING_DATASET') == 'CARRA':
+        elif forcing_dataset == 'CARRA':
             self.logger.info("Creating CARRA grid shapefile")
 
             # Find a processed CARRA file
@@ -1081,22 +1117,21 @@ class SummaPreProcessor_spatial:
 
             # Create shapefile
             self.shapefile_path.mkdir(parents=True, exist_ok=True)
-            output_shapefile = self.shapefile_path / f"forcing_{self.config['FORCING_DATASET']}.shp"
 
             with shapefile.Writer(str(output_shapefile)) as w:
                 w.autoBalance = 1
                 w.field("ID", 'N')
-                w.field(self.config.get('FORCING_SHAPE_LAT_NAME'), 'F', decimal=6)
-                w.field(self.config.get('FORCING_SHAPE_LON_NAME'), 'F', decimal=6)
+                w.field(lat_name, 'F', decimal=6)
+                w.field(lon_name, 'F', decimal=6)
+
+                # Define grid cell (assuming 2.5 km resolution)
+                half_dx = 1250  # meters
+                half_dy = 1250  # meters
 
                 for i in range(len(lons)):
                     # Convert lat/lon to CARRA coordinates
                     x, y = transformer_to_carra.transform(lons[i], lats[i])
                     
-                    # Define grid cell (assuming 2.5 km resolution)
-                    half_dx = 1250  # meters
-                    half_dy = 1250  # meters
-                    
                     vertices = [
                         (x - half_dx, y - half_dy),
                         (x - half_dx, y + half_dy),
@@ -1117,16 +1152,50 @@ class SummaPreProcessor_spatial:
             shp = shp.set_crs('EPSG:4326')
 
             # Calculate zonal statistics (mean elevation) for each grid cell
-            zs = rasterstats.zonal_stats(shp, str(self.dem_path), stats=['mean'])
-
-            # Add mean elevation to the GeoDataFrame
-            shp['elev_m'] = [item['mean'] for item in zs]
+            shp['elev_m'] = self._dem_mean(shp)
 
             # Save the updated shapefile
             shp.to_file(output_shapefile)
 
             self.logger.info(f"CARRA grid shapefile created and saved to {output_shapefile}")
 
+    def _dem_mean(self, gdf):
+        """
+        Calculate the mean DEM elevation for each polygon in a GeoDataFrame.
+
+        Only the DEM window covering the bounding box of the polygons is read from disk,
+        so a DEM larger than the forcing footprint is not loaded in full.
+
+        Args:
+            gdf (gpd.GeoDataFrame): Polygons for which to calculate the mean elevation
+
+        Returns:
+            list: Mean elevation per polygon, None where a polygon has no DEM data
+        """
+        with rasterio.open(self.dem_path) as src:
+            if src.crs is not None:
+                gdf = gdf.to_crs(src.crs)
+
+            # Snap the bounding box outwards to whole pixels and clip it to the raster
+            bounds_window = from_bounds(*gdf.total_bounds, transform=src.transform)
+            col_start = int(np.floor(bounds_window.col_off))
+            row_start = int(np.floor(bounds_window.row_off))
+            col_end = int(np.ceil(bounds_window.col_off + bounds_window.width))
+            row_end = int(np.ceil(bounds_window.row_off + bounds_window.height))
+            try:
+                window = Window(col_start, row_start, col_end - col_start, row_end - row_start).intersection(
+                    Window(0, 0, src.width, src.height))
+            except WindowError:
+                self.logger.warning("Forcing grid does not overlap the DEM")
+                return [None] * len(gdf)
+
+            dem = src.read(1, window=window)
+            transform = src.window_transform(window)
+            nodata = src.nodata
+
+        zs = rasterstats.zonal_stats(gdf, dem, affine=transform, nodata=nodata, stats=['mean'])
+        return [item['mean'] for item in zs]
+
 
     def apply_timestep(self):
         """
@@ -1147,7 +1216,7 @@ class SummaPreProcessor_spatial:
         """
         self.logger.info("Starting to apply data step to forcing files")
 
-        forcing_files = [f for f in self.forcing_summa_path.glob(f"{self.domain_name}_{self.config.get('FORCING_DATASET')}*.nc")]
+        forcing_files = [self.forcing_summa_path / f for f in self._list_forcing_files(self.forcing_summa_path, f"{self.domain_name}_{self.config.get('FORCING_DATASET')}")]
 
         for file in forcing_files:
             self.logger.info(f"Processing {file}")
@@ -1188,9 +1257,12 @@ class SummaPreProcessor_spatial:
         """
         self.logger.info("Starting to merge RDRS forcing data")
 
+        time_start = self.config.get('EXPERIMENT_TIME_START')
+        time_end = self.config.get('EXPERIMENT_TIME_END')
+
         years = [
-                    self.config.get('EXPERIMENT_TIME_START').split('-')[0],  # Get year from full datetime
-                    self.config.get('EXPERIMENT_TIME_END').split('-')[0]
+                    time_start.split('-')[0],  # Get year from full datetime
+                    time_end.split('-')[0]
                 ]
         years = range(int(years[0])-1, int(years[1]) + 1)
         
@@ -1215,37 +1287,50 @@ class SummaPreProcessor_spatial:
             'RDRS_v2.1_P_VVC_10m': 'windspd_v',
         }
 
+        # (variable, scale, offset, attributes); conversions are value * scale + offset
+        unit_conversions = [
+            ('airpres', 100, 0, {'units': 'Pa', 'long_name': 'air pressure', 'standard_name': 'air_pressure'}),  # mb to Pa
+            ('airtemp', 1, 273.15, {'units': 'K', 'long_name': 'air temperature', 'standard_name': 'air_temperature'}),  # deg_C to K
+            ('pptrate', 1 / 3600 * 1000, 0, {'units': 'm s-1', 'long_name': 'precipitation rate', 'standard_name': 'precipitation_rate'}),
+            ('windspd', 0.514444, 0, {'units': 'm s-1', 'long_name': 'wind speed', 'standard_name': 'wind_speed'}),  # knots to m/s
+            ('LWRadAtm', None, None, {'long_name': 'downward longwave radiation at the surface', 'standard_name': 'surface_downwelling_longwave_flux_in_air'}),
+            ('SWRadAtm', None, None, {'long_name': 'downward shortwave radiation at the surface', 'standard_name': 'surface_downwelling_shortwave_flux_in_air'}),
+            ('spechum', None, None, {'long_name': 'specific humidity', 'standard_name': 'specific_humidity'}),
+        ]
+
         def process_rdrs_data(ds):
             existing_vars = {old: new for old, new in variable_mapping.items() if old in ds.variables}
             ds = ds.rename(existing_vars)
-            
-            if 'airpres' in ds:
-                ds['airpres'] = ds['airpres'] * 100
-                ds['airpres'].attrs.update({'units': 'Pa', 'long_name': 'air pressure', 'standard_name': 'air_pressure'})
-            
-            if 'airtemp' in ds:
-                ds['airtemp'] = ds['airtemp'] + 273.15
-                ds['airtemp'].attrs.update({'units': 'K', 'long_name': 'air temperature', 'standard_name': 'air_temperature'})
-            
-            if 'pptrate' in ds:
-                ds['pptrate'] = ds['pptrate'] / 3600 * 1000
-                ds['pptrate'].attrs.update({'units': 'm s-1', 'long_name': 'precipitation rate', 'standard_name': 'precipitation_rate'})
-            
-            if 'windspd' in ds:
-                ds['windspd'] = ds['windspd'] * 0.514444
-                ds['windspd'].attrs.update({'units': 'm s-1', 'long_name': 'wind speed', 'standard_name': 'wind_speed'})
-            
-            if 'LWRadAtm' in ds:
-                ds['LWRadAtm'].attrs.update({'long_name': 'downward longwave radiation at the surface', 'standard_name': 'surface_downwelling_longwave_flux_in_air'})
-            
-            if 'SWRadAtm' in ds:
-                ds['SWRadAtm'].attrs.update({'long_name': 'downward shortwave radiation at the surface', 'standard_name': 'surface_downwelling_shortwave_flux_in_air'})
-            
-            if 'spechum' in ds:
-                ds['spechum'].attrs.update({'long_name': 'specific humidity', 'standard_name': 'specific_humidity'})
-            
+
+            # Convert the underlying (dask) arrays in place so attributes are not copied per variable
+            for var, scale, offset, attrs in unit_conversions:
+                if var not in ds:
+                    continue
+                da = ds[var]
+                if scale is not None:
+                    da.data = da.data * scale + offset
+                da.attrs.update(attrs)
+
             return ds
 
+        def open_month(files):
+            return xr.open_mfdataset(
+                files,
+                combine='nested',
+                concat_dim='time',
+                preprocess=process_rdrs_data,
+                chunks={'time': 24, 'rlat': -1, 'rlon': -1}
+            )
+
+        def file_is_valid(file):
+            try:
+                with xr.open_dataset(file) as ds:
+                    process_rdrs_data(ds)
+                return True
+            except Exception as e:
+                self.logger.error(f"Error opening file {file}: {str(e)}")
+                return False
+
         for year in years:
             self.logger.info(f"Processing year {year}")
             year_folder = raw_forcing_path / str(year)
@@ -1259,32 +1344,22 @@ class SummaPreProcessor_spatial:
                     self.logger.warning(f"No files found for {year}-{month:02d}")
                     continue
                 
-                datasets = []
-                for file in daily_files:
-                    try:
-                        ds = xr.open_dataset(file)
-                        datasets.append(ds)
-                    except Exception as e:
-                        self.logger.error(f"Error opening file {file}: {str(e)}")
-
-                if not datasets:
-                    self.logger.warning(f"No valid datasets for {year}-{month:02d}")
-                    continue
-
-                processed_datasets = []
-                for ds in datasets:
+                # Open the month lazily; daily files are already in time order from the sorted glob
+                try:
+                    monthly_data = open_month(daily_files)
+                except Exception as e:
+                    self.logger.error(f"Error opening files for {year}-{month:02d}: {str(e)}")
+
+                    # Retry without the daily files that cannot be opened, so one bad file only loses its own day
+                    valid_files = [file for file in daily_files if file_is_valid(file)]
+                    if not valid_files:
+                        self.logger.warning(f"No valid datasets for {year}-{month:02d}")
+                        continue
                     try:
-                        processed_ds = process_rdrs_data(ds)
-                        processed_datasets.append(processed_ds)
+                        monthly_data = open_month(valid_files)
                     except Exception as e:
-                        self.logger.error(f"Error processing dataset: {str(e)}")
-
-                if not processed_datasets:
-                    self.logger.warning(f"No processed datasets for {year}-{month:02d}")
-                    continue
-
-                monthly_data = xr.concat(processed_datasets, dim="time")
-                monthly_data = monthly_data.sortby("time")
+                        self.logger.error(f"Error opening files for {year}-{month:02d}: {str(e)}")
+                        continue
 
                 start_time = pd.Timestamp(year, month, 1)
                 if month == 12:
@@ -1297,9 +1372,6 @@ class SummaPreProcessor_spatial:
                 expected_times = pd.date_range(start=start_time, end=end_time, freq='h')
                 monthly_data = monthly_data.reindex(time=expected_times, method='nearest')
 
-                monthly_data['time'].encoding['units'] = 'hours since 1900-01-01'
-                monthly_data['time'].encoding['calendar'] = 'gregorian'
-
                 monthly_data.attrs.update({
                     'History': f'Created {time.ctime(time.time())}',
                     'Language': 'Written using Python',
@@ -1309,11 +1381,13 @@ class SummaPreProcessor_spatial:
                 for var in monthly_data.data_vars:
                     monthly_data[var].attrs['missing_value'] = -999
 
+                encoding = {'time': {'units': 'hours since 1900-01-01', 'calendar': 'gregorian'}}
+
+                # Stream the month to disk one week of hourly steps at a time
                 output_file = self.merged_forcing_path / f"RDRS_monthly_{year}{month:02d}.nc"
-                monthly_data.to_netcdf(output_file)
+                monthly_data.chunk({'time': 168}).to_netcdf(output_file, engine='h5netcdf', encoding=encoding)
 
-                for ds in datasets:
-                    ds.close()
+                monthly_data.close()
 
         self.logger.info("RDRS forcing data merging completed")
 
@@ -1341,17 +1415,11 @@ class SummaPreProcessor_spatial:
         forcing_path = self.project_dir / 'forcing/SUMMA_input'
         file_list_path = self.summa_setup_dir / self.config.get('SETTINGS_SUMMA_FORCING_LIST')
 
-        if forcing_dataset == 'CARRA':
-            forcing_files = [f for f in os.listdir(forcing_path) if f.startswith(f"{domain_name}_{forcing_dataset}") and f.endswith('.nc')]
-        elif forcing_dataset == 'ERA5':
-            forcing_files = [f for f in os.listdir(forcing_path) if f.startswith(f"{domain_name}_{forcing_dataset}") and f.endswith('.nc')]
-        elif forcing_dataset == 'RDRS':
-            forcing_files = [f for f in os.listdir(forcing_path) if f.startswith(f"{domain_name}_{forcing_dataset}") and f.endswith('.nc')]
-        else:
+        if forcing_dataset not in ('CARRA', 'ERA5', 'RDRS'):
             self.logger.error(f"Unsupported forcing dataset: {forcing_dataset}")
             raise ValueError(f"Unsupported forcing dataset: {forcing_dataset}")
 
-        forcing_files.sort()
+        forcing_files = self._list_forcing_files(forcing_path, f"{domain_name}_{forcing_dataset}")
 
         with open(file_list_path, 'w') as f:
             for file in forcing_files:
@@ -1360,6 +1428,31 @@ class SummaPreProcessor_spatial:
         self.logger.info(f"Forcing file list created at {file_list_path}")
 
 
+    def _forcing_hruIds(self):
+        """
+        HRU IDs in the order used by the SUMMA forcing files.
+
+        Read from the first forcing file in the SUMMA input directory and shared by
+        create_initial_conditions, create_trial_parameters and create_attributes_file.
+        Only a successful read is kept, so a call made before the forcing files are
+        written does not stop later calls from finding them.
+
+        Returns:
+            np.ndarray or None: HRU IDs as int64, or None if no forcing files were found.
+        """
+        if self._forcing_hru_ids is not None:
+            return self._forcing_hru_ids
+
+        forcing_files = sorted(self.forcing_summa_path.glob('*.nc'))
+        if not forcing_files:
+            return None
+
+        # Only the raw hruId vector is needed, so read it with netCDF4 and skip xarray's decoding entirely
+        with nc4.Dataset(forcing_files[0], 'r') as forc:
+            forc.set_auto_mask(False)
+            self._forcing_hru_ids = np.asarray(forc.variables['hruId'][:]).astype(np.int64, copy=False)
+        return self._forcing_hru_ids
+
     def create_initial_conditions(self):
         """
         Create the initial conditions (cold state) file for SUMMA.
@@ -1378,18 +1471,12 @@ class SummaPreProcessor_spatial:
             ValueError: If there are inconsistencies between the cold state and forcing data.
         """
         self.logger.info("Creating initial conditions (cold state) file")
-        self.logger.info("Creating initial conditions (cold state) file")
 
-        # Find a forcing file to use as a template for hruId order
-        forcing_files = list(self.forcing_summa_path.glob('*.nc'))
-        if not forcing_files:
+        # Get the hruId order from the forcing files
+        forcing_hruIds = self._forcing_hruIds()
+        if forcing_hruIds is None:
             self.logger.error("No forcing files found in the SUMMA input directory")
             return
-        forcing_file = forcing_files[0]
-
-        # Get the sorting order from the forcing file
-        with xr.open_dataset(forcing_file) as forc:
-            forcing_hruIds = forc['hruId'].values.astype(int)
 
         num_hru = len(forcing_hruIds)
 
@@ -1423,46 +1510,54 @@ class SummaPreProcessor_spatial:
 
         coldstate_path = self.settings_path / self.coldstate_name
 
-        def create_and_fill_nc_var(nc, newVarName, newVarVal, fillDim1, fillDim2, newVarDim, newVarType, fillVal):
-            if newVarName in ['iLayerHeight', 'mLayerDepth']:
-                fillWithThis = np.full((fillDim1, fillDim2), newVarVal).transpose()
-            else:
-                fillWithThis = np.full((fillDim1, fillDim2), newVarVal)
-            
-            ncvar = nc.createVariable(newVarName, newVarType, (newVarDim, 'hru'), fill_value=fillVal)
-            ncvar[:] = fillWithThis
+        # (name, value, layer dimension, dtype) of each state variable; values are broadcast across HRUs
+        state_vars = [
+            ('dt_init', self.data_step, 'scalarv', 'f8'),
+            ('nSoil', nSoil, 'scalarv', 'i4'),
+            ('nSnow', nSnow, 'scalarv', 'i4'),
+        ]
+        for var_name, var_value in states.items():
+            state_vars.append((var_name, var_value, 'midToto' if var_name.startswith('mLayer') else 'scalarv', 'f8'))
+        state_vars.append(('iLayerHeight', iLayerHeight, 'ifcToto', 'f8'))
+        state_vars.append(('mLayerDepth', mLayerDepth, 'midToto', 'f8'))
 
         with nc4.Dataset(coldstate_path, "w", format="NETCDF4") as cs:
-            # Set attributes
-            cs.setncattr('Author', "Created by SUMMA workflow scripts")
-            cs.setncattr('History', f'Created {datetime.now().strftime("%Y/%m/%d %H:%M:%S")}')
-            cs.setncattr('Purpose', 'Create a cold state .nc file for initial SUMMA runs')
+            # Define the complete file layout (attributes, dimensions, variables) before writing any data
+            cs.setncatts({
+                'Author': "Created by SUMMA workflow scripts",
+                'History': f'Created {datetime.now().strftime("%Y/%m/%d %H:%M:%S")}',
+                'Purpose': 'Create a cold state .nc file for initial SUMMA runs',
+            })
 
-            # Define dimensions
             cs.createDimension('hru', num_hru)
             cs.createDimension('midSoil', midSoil)
             cs.createDimension('midToto', midToto)
             cs.createDimension('ifcToto', ifcToto)
             cs.createDimension('scalarv', scalarv)
 
-            # Create variables
-            var = cs.createVariable('hruId', 'i4', 'hru', fill_value=False)
-            var.setncattr('units', '-')
-            var.setncattr('long_name', 'Index of hydrological response unit (HRU)')
-            var[:] = forcing_hruIds
+            hru_var = cs.createVariable('hruId', 'i4', 'hru', fill_value=False, zlib=False, contiguous=True)
+            hru_var.setncatts({'units': '-', 'long_name': 'Index of hydrological response unit (HRU)'})
 
-            create_and_fill_nc_var(cs, 'dt_init', self.data_step, 1, num_hru, 'scalarv', 'f8', False)
-            create_and_fill_nc_var(cs, 'nSoil', nSoil, 1, num_hru, 'scalarv', 'i4', False)
-            create_and_fill_nc_var(cs, 'nSnow', nSnow, 1, num_hru, 'scalarv', 'i4', False)
+            fills = []
+            for var_name, var_value, var_dim, var_type in state_vars:
+                ncvar = cs.createVariable(var_name, var_type, (var_dim, 'hru'), fill_value=False, zlib=False, contiguous=True)
+                fills.append((ncvar, var_value))
 
-            for var_name, var_value in states.items():
-                if var_name.startswith('mLayer'):
-                    create_and_fill_nc_var(cs, var_name, var_value, midToto, num_hru, 'midToto', 'f8', False)
-                else:
-                    create_and_fill_nc_var(cs, var_name, var_value, 1, num_hru, 'scalarv', 'f8', False)
+            # One scratch buffer per (layer dimension, dtype), reused by every variable of that shape
+            dim_sizes = {'scalarv': scalarv, 'midToto': midToto, 'ifcToto': ifcToto}
+            scratch = {}
 
-            create_and_fill_nc_var(cs, 'iLayerHeight', iLayerHeight, num_hru, ifcToto, 'ifcToto', 'f8', False)
-            create_and_fill_nc_var(cs, 'mLayerDepth', mLayerDepth, num_hru, midToto, 'midToto', 'f8', False)
+            # Write data, one pass per variable
+            hru_var[:] = forcing_hruIds
+            for ncvar, var_value in fills:
+                key = (ncvar.dimensions[0], ncvar.dtype)
+                if key not in scratch:
+                    scratch[key] = np.empty((dim_sizes[key[0]], num_hru), dtype=ncvar.dtype)
+                buf = scratch[key]
+
+                # Scalars fill every element; layer profiles are broadcast along the hru dimension
+                buf[...] = np.reshape(var_value, (-1, 1))
+                ncvar[:] = buf
 
         self.logger.info(f"Initial conditions file created at: {coldstate_path}")
 
@@ -1486,16 +1581,11 @@ class SummaPreProcessor_spatial:
         """
         self.logger.info("Creating trial parameters file")
 
-        # Find a forcing file to use as a template for hruId order
-        forcing_files = list(self.forcing_summa_path.glob('*.nc'))
-        if not forcing_files:
+        # Get the hruId order from the forcing files
+        forcing_hruIds = self._forcing_hruIds()
+        if forcing_hruIds is None:
             self.logger.error("No forcing files found in the SUMMA input directory")
             return
-        forcing_file = forcing_files[0]
-
-        # Get the sorting order from the forcing file
-        with xr.open_dataset(forcing_file) as forc:
-            forcing_hruIds = forc['hruId'].values.astype(int)
 
         num_hru = len(forcing_hruIds)
 
@@ -1515,24 +1605,25 @@ class SummaPreProcessor_spatial:
         parameter_path = self.settings_path / self.parameter_name
 
         with nc4.Dataset(parameter_path, "w", format="NETCDF4") as tp:
-            # Set attributes
-            tp.setncattr('Author', "Created by SUMMA workflow scripts")
-            tp.setncattr('History', f'Created {datetime.now().strftime("%Y/%m/%d %H:%M:%S")}')
-            tp.setncattr('Purpose', 'Create a trial parameter .nc file for initial SUMMA runs')
+            # Define the complete file layout (attributes, dimensions, variables) before writing any data
+            tp.setncatts({
+                'Author': "Created by SUMMA workflow scripts",
+                'History': f'Created {datetime.now().strftime("%Y/%m/%d %H:%M:%S")}',
+                'Purpose': 'Create a trial parameter .nc file for initial SUMMA runs',
+            })
 
-            # Define dimensions
             tp.createDimension('hru', num_hru)
 
-            # Create hruId variable
-            var = tp.createVariable('hruId', 'i4', 'hru', fill_value=False)
-            var.setncattr('units', '-')
-            var.setncattr('long_name', 'Index of hydrological response unit (HRU)')
-            var[:] = forcing_hruIds
+            hru_var = tp.createVariable('hruId', 'i4', 'hru', fill_value=False, zlib=False, contiguous=True)
+            hru_var.setncatts({'units': '-', 'long_name': 'Index of hydrological response unit (HRU)'})
+
+            # Variables for specified trial parameters
+            tp_vars = {var: tp.createVariable(var, 'f8', 'hru', fill_value=False, zlib=False, contiguous=True) for var in all_tp}
 
-            # Create variables for specified trial parameters
+            # Write data, one pass per variable
+            hru_var[:] = forcing_hruIds
             for var, val in all_tp.items():
-                tp_var = tp.createVariable(var, 'f8', 'hru', fill_value=False)
-                tp_var[:] = val
+                tp_vars[var][:] = val
 
         self.logger.info(f"Trial parameters file created at: {parameter_path}")
 
@@ -1552,39 +1643,75 @@ class SummaPreProcessor_spatial:
         # Calculate contour lengths using vectorized operation
         contour_lengths = np.sqrt(shp.geometry.area)
         
-        # Read DEM once
+        # Per-HRU slope sums and cell counts, accumulated over DEM tiles (index 0 = outside any HRU)
+        num_hru = len(shp)
+        sums = np.zeros(num_hru + 1, dtype=np.float64)
+        counts = np.zeros(num_hru + 1, dtype=np.int64)
+        geometries = shp.geometry
+        sindex = shp.sindex
+        tile_size = 1024  # DEM rows/columns per tile
+
+        # Read the DEM tile by tile so peak memory is bounded by the tile size, not the raster size
         with rasterio.open(dem_path) as src:
-            dem = src.read(1)
             transform = src.transform
-            
-            # Calculate dx and dy for the entire DEM once
             cell_size_x = transform[0]
             cell_size_y = -transform[4]  # Negative because Y increases downward in pixel space
-            
-            # Calculate gradients for entire DEM once
-            dy, dx = np.gradient(dem, cell_size_y, cell_size_x)
-            slope = np.arctan(np.sqrt(dx*dx + dy*dy))
-            
-            # Use zonal_stats to get mean slope for all HRUs at once
-            mean_slopes = rasterstats.zonal_stats(
-                shp.geometry,
-                slope,
-                affine=transform,
-                stats=['mean'],
-                nodata=np.nan
-            )
-        
-        # Create results dictionary using vectorized operations
-        results = {}
-        for idx, row in shp.iterrows():
-            hru_id = row[self.config.get('CATCHMENT_SHP_HRUID')]
-            avg_slope = mean_slopes[idx]['mean']
-            
-            if avg_slope is None or np.isnan(avg_slope):
-                self.logger.warning(f"No valid slope data found for HRU {hru_id}")
-                results[hru_id] = (0.1, 30)  # Default values
-            else:
-                results[hru_id] = (avg_slope, contour_lengths[idx])
+
+            for row_off in range(0, src.height, tile_size):
+                for col_off in range(0, src.width, tile_size):
+                    tile = Window(col_off, row_off, min(tile_size, src.width - col_off), min(tile_size, src.height - row_off))
+
+                    # Only HRUs intersecting this tile take part in its rasterization
+                    hru_pos = sindex.query(box(*window_bounds(tile, transform)))
+                    shapes = [(geometries.iloc[i], i + 1) for i in hru_pos
+                              if geometries.iloc[i] is not None and not geometries.iloc[i].is_empty]
+                    if not shapes:
+                        continue
+
+                    # Read with a one-cell halo so the central differences at tile edges match a full-DEM gradient
+                    halo_row = max(row_off - 1, 0)
+                    halo_col = max(col_off - 1, 0)
+                    halo_rows = min(tile.row_off + tile.height + 1, src.height) - halo_row
+                    halo_cols = min(tile.col_off + tile.width + 1, src.width) - halo_col
+                    dem = src.read(1, window=Window(halo_col, halo_row, halo_cols, halo_rows))
+
+                    dy, dx = np.gradient(dem, cell_size_y, cell_size_x)
+
+                    # slope = arctan(|grad|), computed in place in the dx buffer to avoid temporaries
+                    slope = np.hypot(dx, dy, out=dx)
+                    np.arctan(slope, out=slope)
+                    del dy
+                    slope = slope[row_off - halo_row:row_off - halo_row + tile.height,
+                                  col_off - halo_col:col_off - halo_col + tile.width]
+
+                    # Label each cell with the 1-based position of its HRU (0 = outside)
+                    labels = features.rasterize(
+                        shapes,
+                        out_shape=slope.shape,
+                        transform=window_transform(tile, transform),
+                        fill=0,
+                        dtype='int32'
+                    ).ravel()
+                    slope = slope.ravel()
+
+                    in_hru = (labels > 0) & ~np.isnan(slope)
+                    sums += np.bincount(labels[in_hru], weights=slope[in_hru], minlength=num_hru + 1)
+                    counts += np.bincount(labels[in_hru], minlength=num_hru + 1)
+
+        # Mean slope per HRU; HRUs without valid cells get NaN
+        with np.errstate(invalid='ignore', divide='ignore'):
+            means = sums[1:] / counts[1:]
+
+        # Create results dictionary from the columnar HRU IDs, slopes and contour lengths
+        hru_ids = shp[self.config.get('CATCHMENT_SHP_HRUID')].to_numpy()
+        contours = contour_lengths.to_numpy()
+        valid = ~np.isnan(means)
+
+        if not valid.all():
+            self.logger.warning(f"No valid slope data found for {int((~valid).sum())} HRUs, using default slope and contour length: {hru_ids[~valid].tolist()}")
+
+        results = dict.fromkeys(hru_ids[~valid].tolist(), (0.1, 30))  # Default values
+        results.update(zip(hru_ids[valid].tolist(), zip(means[valid].tolist(), contours[valid].tolist())))
         
         return results
 
@@ -1606,7 +1733,7 @@ class SummaPreProcessor_spatial:
         if downstream_geometry is None:
             min_dimension = min(hru_geometry.bounds[2] - hru_geometry.bounds[0], 
                             hru_geometry.bounds[3] - hru_geometry.bounds[1])
-            self.logger.info(f"HRU {hru_id} is an outlet. Using minimum dimension: {min_dimension}")
+            self.logger.debug(f"HRU {hru_id} is an outlet. Using minimum dimension: {min_dimension}")
             return min_dimension
 
         # Find the intersection between current and downstream HRUs
@@ -1622,7 +1749,7 @@ class SummaPreProcessor_spatial:
         # Calculate the length of the intersection
         contour_length = intersection.length
         
-        self.logger.info(f"Calculated contour length {contour_length:.2f} m for HRU {hru_id}")
+        self.logger.debug(f"Calculated contour length {contour_length:.2f} m for HRU {hru_id}")
         return contour_length
 
 
@@ -1653,20 +1780,21 @@ class SummaPreProcessor_spatial:
         # Calculate slope and contour length
         slope_contour = self.calculate_slope_and_contour(shp, self.dem_path)
 
-        # Get HRU order from a forcing file
-        forcing_files = list(self.forcing_summa_path.glob('*.nc'))
-        if not forcing_files:
+        # Get the hruId order from the forcing files
+        forcing_hruIds = self._forcing_hruIds()
+        if forcing_hruIds is None:
             self.logger.error("No forcing files found in the SUMMA input directory")
             return
-        forcing_file = forcing_files[0]
-
-        with xr.open_dataset(forcing_file) as forc:
-            forcing_hruIds = forc['hruId'].values.astype(int)
 
         # Sort shapefile based on forcing HRU order
         shp = shp.set_index(self.config.get('CATCHMENT_SHP_HRUID'))
-        shp.index = shp.index.astype(int)
-        shp = shp.loc[forcing_hruIds].reset_index()
+        shp.index = shp.index.astype(np.int64)
+        forcing_index = pd.Index(forcing_hruIds, dtype=np.int64, name=shp.index.name)
+        missing = forcing_index.difference(shp.index)
+        if len(missing) > 0:
+            self.logger.error(f"{len(missing)} forcing HRUs not found in the catchment shapefile: {missing.tolist()}")
+            raise ValueError("Forcing HRUs missing from the catchment shapefile")
+        shp = shp.reindex(forcing_index).reset_index()
 
         # Get number of GRUs and HRUs
         hru_ids = pd.unique(shp[self.config.get('CATCHMENT_SHP_HRUID')].values)
@@ -1677,9 +1805,11 @@ class SummaPreProcessor_spatial:
         attribute_path = self.settings_path / self.attribute_name
 
         with nc4.Dataset(attribute_path, "w", format="NETCDF4") as att:
-            # Set attributes
-            att.setncattr('Author', "Created by SUMMA workflow scripts")
-            att.setncattr('History', f'Created {datetime.now().strftime("%Y/%m/%d %H:%M:%S")}')
+            # Define the complete file layout (attributes, dimensions, variables) before writing any data
+            att.setncatts({
+                'Author': "Created by SUMMA workflow scripts",
+                'History': f'Created {datetime.now().strftime("%Y/%m/%d %H:%M:%S")}',
+            })
 
             # Define dimensions
             att.createDimension('hru', num_hru)
@@ -1704,46 +1834,43 @@ class SummaPreProcessor_spatial:
             }
 
             for var_name, var_attrs in variables.items():
-                var = att.createVariable(var_name, var_attrs['dtype'], var_attrs['dims'], fill_value=False)
-                var.setncattr('units', var_attrs['units'])
-                var.setncattr('long_name', var_attrs['long_name'])
+                var = att.createVariable(var_name, var_attrs['dtype'], var_attrs['dims'], fill_value=False, zlib=False, contiguous=True)
+                var.setncatts({'units': var_attrs['units'], 'long_name': var_attrs['long_name']})
 
             # Fill GRU variable
-            att['gruId'][:] = gru_ids
-
-            # Fill HRU variables
-            for idx in range(num_hru):
-                att['hruId'][idx] = shp.iloc[idx][self.config.get('CATCHMENT_SHP_HRUID')]
-                att['HRUarea'][idx] = shp.iloc[idx][self.config.get('CATCHMENT_SHP_AREA')]
-                att['latitude'][idx] = shp.iloc[idx][self.config.get('CATCHMENT_SHP_LAT')]
-                att['longitude'][idx] = shp.iloc[idx][self.config.get('CATCHMENT_SHP_LON')]
-                att['hru2gruId'][idx] = shp.iloc[idx][self.config.get('CATCHMENT_SHP_GRUID')]
-
-                # Set slope and contour length
-                hru_id = shp.iloc[idx][self.config.get('CATCHMENT_SHP_HRUID')]
-                slope, contour_length = slope_contour.get(hru_id, (0.1, 30))  # Use default values if not found
-                att['tan_slope'][idx] = np.tan(slope)  # Convert slope to tan(slope)
-                att['contourLength'][idx] = contour_length
-                #self.logger.info(f"Setting tan slope to: {np.tan(slope)} and contourLength to: {contour_length} in hru: {hru_id} ")
-
-                att['slopeTypeIndex'][idx] = 1
-                att['mHeight'][idx] = self.forcing_measurement_height
-                att['downHRUindex'][idx] = 0
-                att['elevation'][idx] = -999
-                att['soilTypeIndex'][idx] = -999
-                att['vegTypeIndex'][idx] = -999
-
-                if (idx + 1) % 100 == 0:
-                    self.logger.info(f"Processed {idx + 1} out of {num_hru} HRUs")
+            att['gruId'][:] = np.asarray(gru_ids, dtype=np.int32)
+
+            # Look up slope and contour length per HRU, using default values where none were calculated
+            hru_arr = shp[self.config.get('CATCHMENT_SHP_HRUID')].to_numpy(dtype=np.int32)
+            sc = pd.DataFrame.from_dict(slope_contour, orient='index', columns=['slope', 'contour'])
+            sc = sc.reindex(hru_arr).fillna({'slope': 0.1, 'contour': 30})
+
+            # Fill HRU variables; arrays are built in the variable's dtype so no conversion happens on write
+            att['hruId'][:] = hru_arr
+            att['HRUarea'][:] = shp[self.config.get('CATCHMENT_SHP_AREA')].to_numpy(dtype=np.float64)
+            att['latitude'][:] = shp[self.config.get('CATCHMENT_SHP_LAT')].to_numpy(dtype=np.float64)
+            att['longitude'][:] = shp[self.config.get('CATCHMENT_SHP_LON')].to_numpy(dtype=np.float64)
+            att['hru2gruId'][:] = shp[self.config.get('CATCHMENT_SHP_GRUID')].to_numpy(dtype=np.int32)
+            att['tan_slope'][:] = np.tan(sc['slope'].to_numpy(dtype=np.float64))  # Convert slope to tan(slope)
+            att['contourLength'][:] = sc['contour'].to_numpy(dtype=np.float64)
+            att['slopeTypeIndex'][:] = np.full(num_hru, 1, dtype=np.int32)
+            att['mHeight'][:] = np.full(num_hru, self.forcing_measurement_height, dtype=np.float64)
+            att['downHRUindex'][:] = np.full(num_hru, 0, dtype=np.int32)
+            att['elevation'][:] = np.full(num_hru, -999, dtype=np.float64)
+            att['soilTypeIndex'][:] = np.full(num_hru, -999, dtype=np.int32)
+            att['vegTypeIndex'][:] = np.full(num_hru, -999, dtype=np.int32)
+
+            self.logger.info(f"Processed {num_hru} HRUs")
+
+            # Fill soil class, land class and elevation in the same session; the file is flushed once on close
+            self.insert_soil_class(att)
+            self.insert_land_class(att)
+            self.insert_elevation(att)
 
         self.logger.info(f"Attributes file created at: {attribute_path}")
-        
-        self.insert_soil_class(attribute_path)
-        self.insert_land_class(attribute_path)
-        self.insert_elevation(attribute_path)
 
-    def insert_soil_class(self, attribute_file):
-        """Insert soil class data into the attributes file."""
+    def insert_soil_class(self, att):
+        """Insert soil class data into the attributes file, given as an open netCDF4 Dataset."""
         self.logger.info("Inserting soil class into attributes file")
         '''
         if self.config.get('DATA_ACQUIRE') == 'HPC':
@@ -1770,35 +1897,30 @@ class SummaPreProcessor_spatial:
             intersect_hruId_var = self.config.get('CATCHMENT_SHP_HRUID')
 
             shp = gpd.read_file(intersect_path / intersect_name)
-
-            with nc4.Dataset(attribute_file, "r+") as att:
-                for idx in range(len(att['hruId'])):
-                    attribute_hru = att['hruId'][idx]
-                    shp_mask = (shp[intersect_hruId_var].astype(int) == attribute_hru)
-                    
-                    tmp_hist = []
-                    for j in range(13):
-                        col_name = f'USDA_{j}'
-                        if col_name in shp.columns:
-                            tmp_hist.append(shp[col_name][shp_mask].values[0])
-                        else:
-                            tmp_hist.append(0)
-                    
-                    tmp_hist[0] = -1 # 0 class is no data, glacier or water body
-                    tmp_sc = np.argmax(np.asarray(tmp_hist))
-
-                    if np.max(np.asarray(tmp_hist))==0:
-                        self.logger.warning(f'No valid soil class found for hru_id {attribute_hru}, make gravel/sand class')
-                        tmp_sc = 5
-                    elif shp[f'USDA_{tmp_sc}'][shp_mask].values != tmp_hist[tmp_sc]:
-                        self.logger.warning(f'Index and mode soil class do not match at hru_id {attribute_hru}')
-                        tmp_sc = -999
-                    
-                    self.logger.info(f"Replacing soil class {att['soilTypeIndex'][idx]} with {tmp_sc} at HRU {attribute_hru}")
-                    att['soilTypeIndex'][idx] = tmp_sc
-
-    def insert_land_class(self, attribute_file):
-        """Insert land class data into the attributes file."""
+            shp[intersect_hruId_var] = shp[intersect_hruId_var].astype(np.int64)
+            shp = shp.drop_duplicates(subset=intersect_hruId_var).set_index(intersect_hruId_var)
+            usda_cols = [f'USDA_{j}' for j in range(13)]
+
+            hru_ids = np.asarray(att['hruId'][:]).astype(np.int64)
+
+            # Soil class histogram per HRU in attribute file order
+            hist = self._class_histogram(shp, hru_ids, usda_cols)
+            hist[:, 0] = -1 # 0 class is no data, glacier or water body
+
+            soil_class = hist.argmax(axis=1).astype('i4')
+            no_valid = hist.max(axis=1) == 0
+            soil_class[no_valid] = 5
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for hru_id in hru_ids[no_valid]:
+                    self.logger.debug(f'No valid soil class found for hru_id {hru_id}, make gravel/sand class')
+
+            att['soilTypeIndex'][:] = soil_class
+            self.logger.info(f"Set soil class for {len(hru_ids)} HRUs")
+            if no_valid.any():
+                self.logger.warning(f"No valid soil class found for {int(no_valid.sum())} HRUs, made gravel/sand class")
+
+    def insert_land_class(self, att):
+        """Insert land class data into the attributes file, given as an open netCDF4 Dataset."""
         self.logger.info("Inserting land class into attributes file")
         
         '''
@@ -1825,42 +1947,31 @@ class SummaPreProcessor_spatial:
             intersect_hruId_var = self.config.get('CATCHMENT_SHP_HRUID')
 
             shp = gpd.read_file(intersect_path / intersect_name)
+            shp[intersect_hruId_var] = shp[intersect_hruId_var].astype(np.int64)
+            shp = shp.drop_duplicates(subset=intersect_hruId_var).set_index(intersect_hruId_var)
+            igbp_cols = [f'IGBP_{j}' for j in range(1, 18)]
 
-            is_water = 0
+            hru_ids = np.asarray(att['hruId'][:]).astype(np.int64)
 
-            with nc4.Dataset(attribute_file, "r+") as att:
-                for idx in range(len(att['hruId'])):
-                    attribute_hru = att['hruId'][idx]
-                    shp_mask = (shp[intersect_hruId_var].astype(int) == attribute_hru)
-                    
-                    tmp_hist = []
-                    for j in range(1, 18):
-                        col_name = f'IGBP_{j}'
-                        if col_name in shp.columns:
-                            tmp_hist.append(shp[col_name][shp_mask].values[0])
-                        else:
-                            tmp_hist.append(0)
-                    
-                    tmp_lc = np.argmax(np.asarray(tmp_hist)) + 1
-                    
-                    if shp[f'IGBP_{tmp_lc}'][shp_mask].values != tmp_hist[tmp_lc - 1]:
-                        self.logger.warning(f'Index and mode land class do not match at hru_id {attribute_hru}')
-                        tmp_lc = -999
-                    
-                    if tmp_lc == 17:
-                        if any(val > 0 for val in tmp_hist[0:-1]):  # HRU is mostly water but other land classes are present
-                            tmp_lc = np.argmax(np.asarray(tmp_hist[0:-1])) + 1  # select 2nd-most common class
-                        else:
-                            is_water += 1  # HRU is exclusively water
-                    
-                    self.logger.info(f"Replacing land class {att['vegTypeIndex'][idx]} with {tmp_lc} at HRU {attribute_hru}")
-                    att['vegTypeIndex'][idx] = tmp_lc
+            # Land class histogram per HRU in attribute file order
+            hist = self._class_histogram(shp, hru_ids, igbp_cols)
+
+            land_class = hist.argmax(axis=1) + 1
 
-                self.logger.info(f"{is_water} HRUs were identified as containing only open water. Note that SUMMA skips hydrologic calculations for such HRUs.")
+            # HRUs that are mostly water (class 17) but contain other land classes get the 2nd-most common class
+            mostly_water = land_class == 17
+            other_present = (hist[:, :-1] > 0).any(axis=1)
+            land_class = np.where(mostly_water & other_present, hist[:, :-1].argmax(axis=1) + 1, land_class)
+            is_water = int((mostly_water & ~other_present).sum())  # HRU is exclusively water
 
+            att['vegTypeIndex'][:] = land_class.astype('i4')
+            self.logger.info(f"Set land class for {len(hru_ids)} HRUs")
 
-    def insert_elevation(self, attribute_file):
-        """Insert elevation data into the attributes file."""
+            self.logger.info(f"{is_water} HRUs were identified as containing only open water. Note that SUMMA skips hydrologic calculations for such HRUs.")
+
+
+    def insert_elevation(self, att):
+        """Insert elevation data into the attributes file, given as an open netCDF4 Dataset."""
         self.logger.info("Inserting elevation into attributes file")
         '''
         if self.config.get('DATA_ACQUIRE') == 'HPC':
@@ -1898,42 +2009,103 @@ class SummaPreProcessor_spatial:
             elev_column ='elev_mean'
 
             shp = gpd.read_file(intersect_path / intersect_name)
+            shp[intersect_hruId_var] = shp[intersect_hruId_var].astype(np.int64)
+            shp = shp.drop_duplicates(subset=intersect_hruId_var).set_index(intersect_hruId_var)
 
             do_downHRUindex = self.config.get('SETTINGS_SUMMA_CONNECT_HRUS') == 'yes'
 
-            with nc4.Dataset(attribute_file, "r+") as att:
-                gru_data = {}
-                for idx in range(len(att['hruId'])):
-                    hru_id = att['hruId'][idx]
-                    gru_id = att['hru2gruId'][idx]
-                    shp_mask = (shp[intersect_hruId_var].astype(int) == hru_id)
-                    
-                    if any(shp_mask):
-                        elevation = shp[elev_column][shp_mask].values[0]
-                        att['elevation'][idx] = elevation
-                        self.logger.info(f"Set elevation for HRU {hru_id} to {elevation}")
+            hru_ids = np.asarray(att['hruId'][:]).astype(np.int64)
+            hru_gru_ids = np.asarray(att['hru2gruId'][:])
+
+            # Elevation per HRU in attribute file order; NaN where the HRU is not in the intersection
+            elevation = shp[elev_column].reindex(hru_ids).to_numpy(dtype=np.float64)
+            has_elev = ~np.isnan(elevation)
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for hru_id in hru_ids[~has_elev]:
+                    self.logger.debug(f"No elevation data found for HRU {hru_id}")
+
+            att['elevation'][:] = np.where(has_elev, elevation, np.asarray(att['elevation'][:]))
+            self.logger.info(f"Set elevation for {int(has_elev.sum())} of {len(hru_ids)} HRUs")
+            if not has_elev.all():
+                self.logger.warning(f"No elevation data found for {int((~has_elev).sum())} HRUs")
+
+            if do_downHRUindex:
+                # (hru_id, elevation) pairs per GRU, for the HRUs that have elevation data
+                hru_elev = pd.DataFrame({'gru': hru_gru_ids[has_elev], 'hru': hru_ids[has_elev], 'elev': elevation[has_elev]})
+                gru_data = {
+                    gru_id: list(zip(group['hru'].to_numpy(), group['elev'].to_numpy()))
+                    for gru_id, group in hru_elev.groupby('gru', sort=False)
+                }
 
-                        if do_downHRUindex:
-                            if gru_id not in gru_data:
-                                gru_data[gru_id] = []
-                            gru_data[gru_id].append((hru_id, elevation))
-                    else:
-                        self.logger.warning(f"No elevation data found for HRU {hru_id}")
+                self._set_downHRUindex(att, gru_data, hru_ids)
 
-                if do_downHRUindex:
-                    self._set_downHRUindex(att, gru_data)
+    def _class_histogram(self, shp, hru_ids, class_cols):
+        """
+        Build the per-HRU class histogram from an intersection table.
+
+        Args:
+            shp (pd.DataFrame): Intersection table indexed by HRU ID, one column per class.
+            hru_ids (np.ndarray): HRU IDs in the order of the output rows.
+            class_cols (list[str]): Class column names in the order of the output columns.
 
-    def _set_downHRUindex(self, att, gru_data):
-        """Set the downHRUindex based on elevation data."""
+        Returns:
+            np.ndarray: (len(hru_ids), len(class_cols)) float64 array. Classes missing from the table
+            and NaN counts are 0.
+
+        Raises:
+            KeyError: If any HRU is missing from the intersection table, as no class can be assigned to it.
+        """
+        hist = np.zeros((len(hru_ids), len(class_cols)), dtype=np.float64)
+
+        rows = shp.index.get_indexer(hru_ids)
+        missing = hru_ids[rows < 0]
+        if len(missing):
+            self.logger.error(f"{len(missing)} HRUs not found in the intersection table: {missing.tolist()}")
+            raise KeyError(f"HRUs missing from the intersection table: {missing.tolist()}")
+        present = [j for j, col in enumerate(class_cols) if col in shp.columns]
+        if present:
+            values = shp[[class_cols[j] for j in present]].to_numpy(dtype=np.float64)
+            hist[:, present] = np.nan_to_num(values[rows])
+
+        return hist
+
+    def _set_downHRUindex(self, att, gru_data, hru_all=None):
+        """Set the downHRUindex based on elevation data. hru_all is att['hruId'][:] if the caller has already read it."""
+        if hru_all is None:
+            hru_all = np.asarray(att['hruId'][:])
+        hru_to_idx = dict(zip(hru_all.tolist(), range(len(hru_all))))
+        down = np.asarray(att['downHRUindex'][:]).astype('i4')
+
+        num_set = 0
         for gru_id, hru_list in gru_data.items():
-            sorted_hrus = sorted(hru_list, key=lambda x: x[1], reverse=True)
-            for i, (hru_id, _) in enumerate(sorted_hrus):
-                idx = np.where(att['hruId'][:] == hru_id)[0][0]
-                if i == len(sorted_hrus) - 1:
-                    att['downHRUindex'][idx] = 0  # outlet
-                else:
-                    att['downHRUindex'][idx] = sorted_hrus[i+1][0]
-                self.logger.info(f"Set downHRUindex for HRU {hru_id} to {att['downHRUindex'][idx]}")
+            hrus = np.array([hru_id for hru_id, _ in hru_list])
+            elevs = np.array([elev for _, elev in hru_list], dtype=np.float64)
+
+            # Highest to lowest elevation; stable so ties keep their original order
+            sorted_ids = hrus[np.argsort(-elevs, kind='stable')]
+            idxs = np.fromiter((hru_to_idx[int(h)] for h in sorted_ids), dtype=np.intp, count=len(sorted_ids))
+
+            # Each HRU drains to the next lower one; the lowest is the outlet
+            down[idxs[:-1]] = sorted_ids[1:]
+            down[idxs[-1]] = 0
+            num_set += len(idxs)
+
+        att['downHRUindex'][:] = down
+        self.logger.info(f"Set downHRUindex for {num_set} HRUs in {len(gru_data)} GRUs")
+
+    def _list_forcing_files(self, forcing_path: Path, prefix: str) -> list[str]:
+        """
+        List the netCDF forcing files in a directory whose names start with a prefix.
+
+        Args:
+            forcing_path (Path): Directory to search.
+            prefix (str): Required file name prefix, e.g. '<domain>_<forcing dataset>'.
+
+        Returns:
+            list[str]: Sorted file names (not full paths).
+        """
+        with os.scandir(forcing_path) as entries:
+            return sorted(e.name for e in entries if e.name.startswith(prefix) and e.name.endswith('.nc') and e.is_file())
 
     def _get_default_path(self, path_key: str, default_subpath: str) -> Path:
         """
@@ -1989,6 +2161,34 @@ class SummaPreProcessor_spatial:
         return sim_start, sim_end
 
 
+def _open_raw_netcdf(path: Path, **kwargs) -> xr.Dataset:
+    """
+    Open a netCDF file without CF, time or mask decoding, through h5netcdf where possible.
+
+    Callers decode only the subset they need with xr.decode_cf. Files that h5netcdf cannot read
+    (netCDF-3 classic) are opened with the netcdf4 engine instead.
+
+    Args:
+        path (Path): File to open.
+        **kwargs: Further arguments for xr.open_dataset, e.g. chunks.
+
+    Returns:
+        xr.Dataset: Undecoded dataset; CF attributes such as units and _FillValue are kept in attrs.
+    """
+    raw = {'decode_cf': False, 'decode_times': False, 'mask_and_scale': False}
+    try:
+        return xr.open_dataset(path, engine='h5netcdf', **raw, **kwargs)
+    except (OSError, ValueError):
+        return xr.open_dataset(path, engine='netcdf4', **raw, **kwargs)
+
+
+def _read_raw_variables(path: Path, names: list[str]) -> Dict[str, np.ndarray]:
+    """Read whole variables from a netCDF file without masking or scaling."""
+    with nc4.Dataset(path) as nc:
+        nc.set_auto_maskandscale(False)
+        return {name: nc[name][:] for name in names}
+
+
 class SUMMAPostprocessor:
     """
     Postprocessor for SUMMA model outputs via MizuRoute routing.
@@ -2022,18 +2222,22 @@ class SUMMAPostprocessor:
             # Get simulation reach ID
             sim_reach_ID = self.config.get('SIM_REACH_ID')
             
-            # Read simulation data
-            ds = xr.open_dataset(sim_file_path, engine='netcdf4')
+            # Read simulation data without decoding; only the selected reach is decoded below
+            ds = _open_raw_netcdf(sim_file_path, chunks={'time': 'auto'})
             
-            # Extract data for the specific reach
-            segment_index = ds['reachID'].values == int(sim_reach_ID)
-            sim_df = ds.sel(seg=segment_index)
-            q_sim = sim_df['IRFroutedRunoff'].to_dataframe().reset_index()
-            q_sim.set_index('time', inplace=True)
-            q_sim.index = q_sim.index.round(freq='h')
+            # Locate the reach once, then read only its hyperslab of the routed runoff
+            matches = np.flatnonzero(ds['reachID'].values == int(sim_reach_ID))
+            if len(matches) == 0:
+                self.logger.error(f"Reach {sim_reach_ID} not found in SUMMA/MizuRoute output: {sim_file_path}")
+                ds.close()
+                return None
+            q_reach = xr.decode_cf(ds['IRFroutedRunoff'].isel(seg=int(matches[0])).to_dataset())
+            times = pd.DatetimeIndex(q_reach['time'].values, name='time').round(freq='h')
+            values = q_reach['IRFroutedRunoff'].values.astype(np.float64)
+            ds.close()
             
             # Convert from hourly to daily average
-            q_sim_daily = q_sim['IRFroutedRunoff'].resample('D').mean()
+            q_sim_daily = self._hourly_to_daily_mean(times, values)
             
             # Read existing results file if it exists
             output_file = self.results_dir / f"{self.config['EXPERIMENT_ID']}_results.csv"
@@ -2045,7 +2249,7 @@ class SUMMAPostprocessor:
             # Add SUMMA results
             results_df['SUMMA_discharge_cms'] = q_sim_daily
             
-            # Save updated results
+            # Save updated results; written with pandas so the shared results file keeps its date and number formatting
             results_df.to_csv(output_file)
             
             return output_file
@@ -2054,6 +2258,46 @@ class SUMMAPostprocessor:
             self.logger.error(f"Error extracting SUMMA streamflow: {str(e)}")
             raise
 
+    @staticmethod
+    def _hourly_to_daily_mean(times: pd.DatetimeIndex, values: np.ndarray) -> pd.Series:
+        """
+        Average an hourly series to daily means, ignoring missing values.
+
+        When the series is strictly hourly and on whole hours, the partial first and last days
+        are padded with NaN and the days are averaged with a single reshape over (days, 24);
+        otherwise pandas resampling is used.
+
+        Args:
+            times (pd.DatetimeIndex): Time stamps, rounded to the hour.
+            values (np.ndarray): Values at each time stamp.
+
+        Returns:
+            pd.Series: Daily mean values indexed by day.
+        """
+        hour = pd.Timedelta(hours=1)
+        if len(times) == 0:
+            return pd.Series(values, index=times).resample('D').mean()
+        day_start = times[0].normalize()
+        offset = times[0] - day_start
+        # Compared as timedeltas, as the resolution of the index depends on the pandas version
+        hourly = offset % hour == pd.Timedelta(0) and bool(np.all(np.diff(times.values) == hour.to_timedelta64()))
+        if not hourly:
+            return pd.Series(values, index=times).resample('D').mean()
+
+        # Pad the partial first and last days with NaN so every day is a full row of 24 hours
+        lead = int(offset // hour)
+        n_days = -(-(lead + len(values)) // 24)
+        padded = np.full(n_days * 24, np.nan)
+        padded[lead:lead + len(values)] = values
+        padded = padded.reshape(n_days, 24)
+        valid = ~np.isnan(padded)
+        counts = valid.sum(axis=1)
+        sums = np.where(valid, padded, 0.0).sum(axis=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            daily_values = sums / counts
+        daily_index = pd.date_range(day_start, periods=n_days, freq='D', name=times.name)
+        return pd.Series(daily_values, index=daily_index)
+
 
 class SummaRunner:
     """
@@ -2069,6 +2313,17 @@ class SummaRunner:
         domain_name (str): Name of the domain being processed.
         project_dir (Path): Directory for the current project.
     """
+    # Variables packed to int16 by SETTINGS_SUMMA_MERGE_QUANTIZE: int16. averageRoutedRunoff is not packed,
+    # as mizuRoute reads it without applying scale_factor/add_offset
+    INT16_PACKED_VARS = ('scalarTotalRunoff',)
+
+    # Time attributes of the merged parallel SUMMA output
+    MERGED_TIME_ATTRS = {
+        'units': 'seconds since 1990-1-1 0:0:0.0 -0:00',
+        'calendar': 'standard',
+        'long_name': 'time since time reference (instant)'
+    }
+
     def __init__(self, config: Dict[str, Any], logger: Any):
         self.config = config
         self.logger = logger
@@ -2115,22 +2370,12 @@ class SummaRunner:
             if subbasins_name == 'default':
                 subbasins_name = f"{self.config['DOMAIN_NAME']}_HRUs_{self.config['DOMAIN_DISCRETIZATION']}.shp"
             subbasins_shapefile = self.project_dir / "shapefiles" / "catchment" / subbasins_name
-            
-            # Read shapefile and count unique GRU_IDs
-            gdf = gpd.read_file(subbasins_shapefile)
-            total_grus = len(gdf['GRU_ID'].unique())
-            self.logger.info(f"Counted {total_grus} unique GRUs from shapefile")
+            total_grus = self._count_grus(subbasins_shapefile)
 
         # Get and validate GRUs per job
         grus_per_job = self.config.get('SETTINGS_SUMMA_GRU_PER_JOB')
         if grus_per_job == 'default':
-            if total_grus > 500:
-                # Divide GRUs among 500 jobs (rounded up to ensure all GRUs are covered)
-                grus_per_job = -(-total_grus // 500)  # Ceiling division
-                self.logger.info(f"Setting GRUs per job to {grus_per_job} to distribute {total_grus} GRUs across ~500 jobs")
-            else:
-                grus_per_job = 1
-                self.logger.info("Setting default of 1 GRU per job")
+            grus_per_job = self._estimate_grus_per_job(total_grus)
 
         # Calculate number of array jobs needed
         n_array_jobs = -(-total_grus // grus_per_job)  # Ceiling division
@@ -2154,29 +2399,25 @@ class SummaRunner:
             f.write(slurm_script)
         script_path.chmod(0o755)  # Make executable
         
-        # Submit job
-        
         try:
-            
-            cmd = f"sbatch {script_path}"
-            result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True)
-            job_id = result.stdout.strip().split()[-1]
-            self.logger.info(f"Submitted SLURM array job with ID: {job_id}")
-            
-            # Backup settings if required
+            # Backup settings if required (before submitting, as sbatch --wait blocks until the run is done)
             if self.config.get('EXPERIMENT_BACKUP_SETTINGS') == 'yes':
                 backup_path = summa_out_path / "run_settings"
                 self._backup_settings(settings_path, backup_path)
-                
-            # Wait for SLURM job to complete
-            while True:
-                result = subprocess.run(f"squeue -j {job_id}", shell=True, capture_output=True, text=True)
-                if result.stdout.count('\n') <= 1:  # Only header line remains
-                    break
-                time.sleep(60)  # Check every minute
+            
+            # Submit job and block until all array tasks have finished; sbatch exits non-zero if any task failed
+            self.logger.info(f"Submitting SLURM array job {script_path} and waiting for it to complete")
+            cmd = ['sbatch', '--wait', '--parsable', str(script_path)]
+            result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+            job_id = result.stdout.strip().split(';')[0]
+            self.logger.info(f"SLURM array job {job_id} completed")
+            self._update_gru_timings(job_id, total_grus)
             
             self.logger.info("SUMMA parallel run completed, starting output merge")
             
+            # The MPI merge runs as its own srun job step, so this process never runs under MPI itself
+            if self.config.get('SETTINGS_SUMMA_PARALLEL_MERGE') == 'mpi' and self._launch_mpi_merge():
+                return summa_out_path
             return self.merge_parallel_outputs()
             
         except Exception as e:
@@ -2234,6 +2475,155 @@ echo "Completed all GRUs for this job"
 """
         return script
 
+    def _count_grus(self, shapefile: Path) -> int:
+        """
+        Count the unique GRU_IDs of a catchment shapefile.
+
+        The count is cached in <project>/.gru_count.json, keyed on the modification time and size
+        of the shapefile and its .dbf attribute table, so it is only read again when either changes. Only the GRU_ID
+        column is read, without geometries.
+
+        Args:
+            shapefile (Path): Catchment shapefile.
+
+        Returns:
+            int: Number of unique GRUs.
+        """
+        key = {'path': str(shapefile)}
+        for part in (shapefile, shapefile.with_suffix('.dbf')):
+            if part.exists():
+                stat = part.stat()
+                key[part.suffix] = {'mtime': stat.st_mtime, 'size': stat.st_size}
+        cache_file = self.project_dir / '.gru_count.json'
+        if cache_file.exists():
+            try:
+                cache = json.loads(cache_file.read_text())
+                if cache.get('key') == key:
+                    self.logger.info(f"Using cached count of {cache['count']} unique GRUs for {shapefile.name}")
+                    return int(cache['count'])
+            except (ValueError, KeyError, TypeError) as e:
+                self.logger.warning(f"Ignoring unreadable GRU count cache {cache_file}: {str(e)}")
+
+        try:
+            import pyogrio # type: ignore
+            gru_ids = pyogrio.read_dataframe(shapefile, columns=['GRU_ID'], read_geometry=False)['GRU_ID']
+        except ImportError:
+            gru_ids = gpd.read_file(shapefile, ignore_geometry=True)['GRU_ID']
+
+        total_grus = int(gru_ids.nunique())
+        cache_file.write_text(json.dumps({'key': key, 'count': total_grus}))
+        self.logger.info(f"Counted {total_grus} unique GRUs from shapefile")
+        return total_grus
+
+    def _estimate_grus_per_job(self, total_grus: int) -> int:
+        """
+        Choose the number of GRUs per array job from the measured runtime of previous runs.
+
+        With a cached runtime per GRU, each job gets as many GRUs as fit in half of the SLURM
+        time limit (SETTINGS_SUMMA_TIME_LIMIT). In every case the GRUs are spread over at most
+        500 jobs, which keeps the array within SLURM's default MaxArraySize.
+
+        Args:
+            total_grus (int): Number of GRUs in the domain.
+
+        Returns:
+            int: GRUs per array job.
+        """
+        seconds_per_gru = None
+        timings_file = self.project_dir / '.summa_gru_timings.json'
+        if timings_file.exists():
+            try:
+                seconds_per_gru = float(json.loads(timings_file.read_text())['seconds_per_gru'])
+            except (ValueError, KeyError, TypeError) as e:
+                self.logger.warning(f"Ignoring unreadable GRU timings cache {timings_file}: {str(e)}")
+
+        max_jobs = 500
+        # Fewest GRUs per job that keep the array within max_jobs tasks (ceiling division)
+        min_grus_per_job = max(1, -(-total_grus // max_jobs))
+
+        if seconds_per_gru and seconds_per_gru > 0:
+            time_limit = self._slurm_duration_seconds(self.config.get('SETTINGS_SUMMA_TIME_LIMIT'))
+            if time_limit and seconds_per_gru > time_limit:
+                self.logger.warning(f"A single GRU took {seconds_per_gru:.0f} s in the last run, longer than the "
+                                    f"SLURM time limit of {time_limit:.0f} s; array tasks are likely to time out")
+            target_seconds = 0.5 * time_limit if time_limit else 30 * 60
+            grus_per_job = max(min_grus_per_job, int(target_seconds / seconds_per_gru))
+            grus_per_job = min(max(total_grus, 1), grus_per_job)
+            if time_limit and seconds_per_gru <= time_limit < grus_per_job * seconds_per_gru:
+                self.logger.warning(f"Keeping the array within {max_jobs} jobs needs {grus_per_job} GRUs per job, an estimated "
+                                    f"{grus_per_job * seconds_per_gru:.0f} s against a time limit of {time_limit:.0f} s")
+            self.logger.info(f"Setting GRUs per job to {grus_per_job} from a measured {seconds_per_gru:.1f} s per GRU "
+                             f"and a target of {target_seconds / 60:.0f} min per job (at most {max_jobs} jobs)")
+        elif total_grus > max_jobs:
+            # Divide GRUs among 500 jobs (rounded up to ensure all GRUs are covered)
+            grus_per_job = min_grus_per_job
+            self.logger.info(f"Setting GRUs per job to {grus_per_job} to distribute {total_grus} GRUs across ~500 jobs")
+        else:
+            grus_per_job = 1
+            self.logger.info("Setting default of 1 GRU per job")
+        return grus_per_job
+
+    def _update_gru_timings(self, job_id: str, total_grus: int):
+        """
+        Cache the mean runtime per GRU of a completed array job, as reported by sacct.
+
+        Failures are logged and otherwise ignored, as the cache only tunes later runs.
+        """
+        try:
+            result = subprocess.run(
+                ['sacct', '-j', job_id, '--format=JobID,Elapsed', '--parsable2', '--noheader'],
+                check=True, capture_output=True, text=True
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            self.logger.warning(f"Could not read the runtime of SLURM job {job_id} from sacct: {str(e)}")
+            return
+
+        # Array tasks are reported as <job_id>_<task>; their job steps (.batch, .extern) are skipped
+        elapsed = [
+            self._slurm_duration_seconds(line.split('|')[1])
+            for line in result.stdout.splitlines()
+            if line.count('|') >= 1 and line.split('|')[0].startswith(f"{job_id}_") and '.' not in line.split('|')[0]
+        ]
+        elapsed = [e for e in elapsed if e is not None]
+        if not elapsed or total_grus <= 0:
+            self.logger.warning(f"No array task runtimes found for SLURM job {job_id}")
+            return
+
+        seconds_per_gru = sum(elapsed) / total_grus
+        timings_file = self.project_dir / '.summa_gru_timings.json'
+        timings_file.write_text(json.dumps({'job_id': job_id, 'seconds_per_gru': seconds_per_gru}))
+        self.logger.info(f"Measured {seconds_per_gru:.1f} s per GRU for SLURM job {job_id}")
+
+    @staticmethod
+    def _slurm_duration_seconds(value) -> Optional[float]:
+        """
+        Convert a SLURM duration to seconds, or None if it cannot be parsed.
+
+        Accepted forms are MM, MM:SS and HH:MM:SS, and the day-prefixed D-HH, D-HH:MM and
+        D-HH:MM:SS, where the field after the day is always hours.
+        """
+        try:
+            days, sep, clock = str(value).strip().partition('-')
+            if not sep:
+                days, clock = '0', days
+            parts = [float(p) for p in clock.split(':')]
+            if sep:
+                if not 1 <= len(parts) <= 3:
+                    return None
+                parts += [0.0] * (3 - len(parts))
+                hours, minutes, seconds = parts
+            elif len(parts) == 1:
+                hours, minutes, seconds = 0.0, parts[0], 0.0
+            elif len(parts) == 2:
+                hours, (minutes, seconds) = 0.0, parts
+            elif len(parts) == 3:
+                hours, minutes, seconds = parts
+            else:
+                return None
+            return float(days) * 86400 + hours * 3600 + minutes * 60 + seconds
+        except ValueError:
+            return None
+
     def run_summa_serial(self):
         """
         Run the SUMMA model.
@@ -2268,11 +2658,11 @@ echo "Completed all GRUs for this job"
 
         # Run SUMMA
         os.makedirs(summa_log_path, exist_ok=True)
-        summa_command = f"{str(summa_path / summa_exe)} -m {str(settings_path / filemanager)}"
+        summa_command = [str(summa_path / summa_exe), '-m', str(settings_path / filemanager)]
         
         try:
             with open(summa_log_path / summa_log_name, 'w') as log_file:
-                subprocess.run(summa_command, shell=True, check=True, stdout=log_file, stderr=subprocess.STDOUT)
+                subprocess.run(summa_command, check=True, stdout=log_file, stderr=subprocess.STDOUT)
             self.logger.info("SUMMA run completed successfully")
             return summa_out_path
         
@@ -2287,8 +2677,8 @@ echo "Completed all GRUs for this job"
         return Path(path)
 
     def _backup_settings(self, source_path: Path, backup_path: Path):
-        backup_path.mkdir(parents=True, exist_ok=True)
-        os.system(f"cp -R {source_path}/. {backup_path}")
+        # shutil copies file contents with os.sendfile on Linux, so no userspace buffers or shell are involved
+        shutil.copytree(source_path, backup_path, dirs_exist_ok=True)
         self.logger.info(f"Settings backed up to {backup_path}")
 
     def merge_parallel_outputs(self):
@@ -2324,40 +2714,57 @@ echo "Completed all GRUs for this job"
                     self.logger.warning(f"No files found matching pattern: {file_pattern}")
                     return
                 
-                merged_ds = None
-                for src_file in input_files:
-                    try:
-                        ds = xr.open_dataset(src_file)
-                        
-                        # Convert time to seconds since reference date
-                        reference_date = pd.Timestamp('1990-01-01')
-                        time_values = pd.to_datetime(ds.time.values)
-                        seconds_since_ref = (time_values - reference_date).total_seconds()
-                        
-                        # Replace the time coordinate with seconds since reference
-                        ds = ds.assign_coords(time=seconds_since_ref)
-                        
-                        # Set time attributes
-                        ds.time.attrs = {
-                            'units': 'seconds since 1990-1-1 0:0:0.0 -0:00',
-                            'calendar': 'standard',
-                            'long_name': 'time since time reference (instant)'
-                        }
-                        
-                        # Merge with existing data
-                        if merged_ds is None:
-                            merged_ds = ds
-                        else:
-                            merged_ds = xr.merge([merged_ds, ds])
-                        
-                        ds.close()
-                        
-                    except Exception as e:
-                        self.logger.error(f"Error processing file {src_file}: {str(e)}")
-                        continue
+                use_mpi = self.config.get('SETTINGS_SUMMA_PARALLEL_MERGE') == 'mpi'
+                comm, rank, _ = self._mpi_comm() if use_mpi else (None, 0, 1)
+                rechunk = self.config.get('SETTINGS_SUMMA_RECHUNK_BEFORE_MERGE', False)
+                chunk_dir = None
+                
+                if rechunk:
+                    # Only rank 0 rechunks, into a scratch directory next to the SUMMA outputs;
+                    # the other ranks wait for its list of files
+                    if rank == 0:
+                        chunk_dir = Path(tempfile.mkdtemp(prefix='.summa_rechunk_', dir=summa_out_path.parent))
+                        input_files = self._rechunk_summa_outputs(input_files, chunk_dir)
+                    if comm is not None:
+                        input_files = comm.bcast(input_files, root=0)
+                
+                try:
+                    merge_files(input_files, output_file, use_mpi, rank)
+                finally:
+                    # Remove the rechunked copies once every rank has finished reading them
+                    if rechunk and comm is not None:
+                        comm.Barrier()
+                    if chunk_dir is not None:
+                        shutil.rmtree(chunk_dir, ignore_errors=True)
+            
+            def merge_files(input_files, output_file, use_mpi, rank):
+                if use_mpi and self._merge_with_mpi(input_files, output_file):
+                    return
+                
+                # Without the MPI merge only rank 0 falls back, so the other tasks do not write the same output file
+                if rank != 0:
+                    return
+                
+                merge_tool = self.config.get('SETTINGS_SUMMA_MERGE_TOOL', 'xarray')
+                if merge_tool == 'nco' and self._merge_with_nco(input_files, output_file):
+                    return
+                if merge_tool == 'netcdf4':
+                    self._merge_with_netcdf4(input_files, output_file)
+                    return
+                
+                # Open all files lazily and in parallel, then combine them in a single pass
+                datasets = self._open_summa_outputs(input_files)
+                merged_ds = self._combine_summa_outputs(datasets) if datasets else None
                 
                 # Save merged data
                 if merged_ds is not None:
+                    # Decode only the time axis, then convert it to seconds since reference date, once for the combined dataset
+                    time_values = xr.decode_cf(merged_ds[['time']]).time.values
+                    merged_ds = merged_ds.assign_coords(time=self._seconds_since_1990(time_values))
+                    
+                    # Set time attributes
+                    merged_ds.time.attrs = dict(self.MERGED_TIME_ATTRS)
+                    
                     # Create encoding dict for all variables
                     encoding = {
                         'time': {
@@ -2366,9 +2773,22 @@ echo "Completed all GRUs for this job"
                         }
                     }
                     
-                    # Add encoding for all other variables
+                    # Add encoding for all other variables, with chunks that keep the full time series together;
+                    # data are copied undecoded, so each variable keeps its source fill value
                     for var in merged_ds.data_vars:
-                        encoding[var] = {'_FillValue': None}
+                        encoding[var] = {'_FillValue': merged_ds[var].attrs.pop('_FillValue', None)}
+                        if merged_ds[var].ndim > 0:
+                            encoding[var].update({
+                                'chunksizes': self._choose_chunks(merged_ds[var].shape, merged_ds[var].dims, merged_ds[var].dtype.itemsize),
+                                'zlib': True,
+                                'complevel': 1,
+                                'shuffle': True
+                            })
+                    
+                    # Optionally store floating point variables at reduced precision
+                    quantize = self.config.get('SETTINGS_SUMMA_MERGE_QUANTIZE', False)
+                    if quantize:
+                        merged_ds = self._quantize_merged_output(merged_ds, encoding, pack_int16=(quantize == 'int16'))
                     
                     # Preserve the original attributes
                     if 'summaVersion' in merged_ds.attrs:
@@ -2384,15 +2804,20 @@ echo "Completed all GRUs for this job"
                     # Update merged dataset attributes
                     merged_ds.attrs.update(global_attrs)
                     
-                    # Save to netCDF
-                    merged_ds.to_netcdf(
+                    # Save to netCDF, streaming the dask chunks to disk on the threaded scheduler
+                    delayed_write = merged_ds.to_netcdf(
                         output_file,
                         encoding=encoding,
                         unlimited_dims=['time'],
-                        format='NETCDF4'
+                        format='NETCDF4',
+                        engine='h5netcdf',
+                        compute=False
                     )
+                    delayed_write.compute(scheduler='threads')
                     self.logger.info(f"Successfully created merged file: {output_file}")
                     merged_ds.close()
+                    for ds in datasets:
+                        ds.close()
             
             # Process both timestep and daily files
             process_and_merge_files(timestep_pattern, timestep_output)
@@ -2405,3 +2830,537 @@ echo "Completed all GRUs for this job"
             self.logger.error(f"Error merging SUMMA outputs: {str(e)}")
             raise
 
+    def _quantize_merged_output(self, merged_ds: xr.Dataset, encoding: dict, pack_int16: bool = False) -> xr.Dataset:
+        """
+        Store float64 variables of the merged output as float32, and optionally pack INT16_PACKED_VARS to int16.
+
+        Packed variables use scale_factor/add_offset spanning their valid range, with -32768 as fill value.
+
+        Args:
+            merged_ds (xr.Dataset): Merged, undecoded SUMMA output.
+            encoding (dict): Per-variable netCDF encoding, updated in place.
+            pack_int16 (bool): Also pack INT16_PACKED_VARS to int16.
+
+        Returns:
+            xr.Dataset: Dataset with the float64 variables cast to float32.
+        """
+        for var in merged_ds.data_vars:
+            if merged_ds[var].dtype == np.float64:
+                merged_ds[var] = merged_ds[var].astype(np.float32)
+                encoding[var]['dtype'] = 'float32'
+
+        if not pack_int16:
+            return merged_ds
+
+        for var in self.INT16_PACKED_VARS:
+            if var not in merged_ds.data_vars:
+                continue
+            fill_value = encoding[var].get('_FillValue')
+            data = merged_ds[var]
+            if fill_value is not None:
+                data = data.where(data != fill_value)
+            vmin, vmax = (float(v) for v in dask.compute(data.min(), data.max()))
+            if np.isnan(vmin):
+                continue
+            # Map [vmin, vmax] onto [-32766, 32766], keeping -32768 free for the fill value
+            scale_factor = (vmax - vmin) / 65532.0 if vmax > vmin else 1.0
+            merged_ds[var] = data
+            encoding[var].update({
+                'dtype': 'int16',
+                'scale_factor': scale_factor,
+                'add_offset': (vmax + vmin) / 2.0,
+                '_FillValue': np.int16(-32768)
+            })
+            self.logger.info(f"Packing {var} to int16 with scale_factor {scale_factor:.6g}")
+        return merged_ds
+
+    def _rechunk_summa_outputs(self, input_files: list[Path], chunked_path: Path) -> list[Path]:
+        """
+        Rechunk per-GRU SUMMA outputs to time-contiguous chunks with nccopy, in parallel.
+
+        Args:
+            input_files (list[Path]): SUMMA output files to rechunk.
+            chunked_path (Path): Directory for the rechunked copies.
+
+        Returns:
+            list[Path]: Rechunked files in input order; a file that could not be rechunked is kept as is.
+        """
+        if shutil.which('nccopy') is None:
+            self.logger.warning("nccopy not found, merging SUMMA outputs without rechunking")
+            return input_files
+
+        chunked_path.mkdir(parents=True, exist_ok=True)
+
+        def rechunk_one(src_file):
+            dst_file = chunked_path / src_file.name
+            try:
+                with nc4.Dataset(src_file) as nc:
+                    chunk_spec = ','.join(
+                        f"{name}/{len(dim)}" if name == 'time' else f"{name}/1"
+                        for name, dim in nc.dimensions.items() if name in ('time', 'gru', 'hru')
+                    )
+                self._rechunk_summa_output(src_file, dst_file, chunk_spec)
+                return dst_file
+            except (OSError, subprocess.CalledProcessError) as e:
+                self.logger.warning(f"Could not rechunk {src_file}, merging it as is: {str(e)}")
+                return src_file
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            rechunked = list(executor.map(rechunk_one, input_files))
+
+        self.logger.info(f"Rechunked {sum(f.parent == chunked_path for f in rechunked)} of {len(input_files)} files into {chunked_path}")
+        return rechunked
+
+    def _rechunk_summa_output(self, src: Path, dst: Path, chunk_spec: str):
+        """
+        Copy a netCDF file to netCDF-4 with the given chunking (nccopy -c syntax, e.g. 'time/8760,gru/1,hru/1').
+
+        Raises:
+            OSError: If nccopy is not available.
+            subprocess.CalledProcessError: If nccopy fails.
+        """
+        subprocess.run(
+            ['nccopy', '-k', '4', '-d', '1', '-w', '-h', '200M', '-c', chunk_spec, str(src), str(dst)],
+            check=True, capture_output=True, text=True
+        )
+
+    def _seconds_since_1990(self, time_values) -> np.ndarray:
+        """Convert datetime64 values to seconds since 1990-01-01, the time reference of the merged output."""
+        seconds = np.asarray(time_values).astype('datetime64[s]').view('int64')
+        reference = np.datetime64('1990-01-01T00:00:00', 's').view('int64')
+        return (seconds - reference).astype('float64')
+
+    def _mpi_comm(self) -> tuple:
+        """
+        Return (comm, rank, size) of the MPI job the merge runs in.
+
+        comm is None if mpi4py is not available; the rank and size then come from the launcher's
+        environment, so tasks started with srun still agree on which one is rank 0.
+        """
+        try:
+            from mpi4py import MPI # type: ignore
+            comm = MPI.COMM_WORLD
+            return comm, comm.Get_rank(), comm.Get_size()
+        except ImportError:
+            for rank_var, size_var in (('PMI_RANK', 'PMI_SIZE'), ('OMPI_COMM_WORLD_RANK', 'OMPI_COMM_WORLD_SIZE'), ('SLURM_PROCID', 'SLURM_NTASKS')):
+                if rank_var in os.environ:
+                    return None, int(os.environ[rank_var]), int(os.environ.get(size_var, 1))
+            return None, 0, 1
+
+    def _launch_mpi_merge(self) -> bool:
+        """
+        Run the MPI merge of parallel SUMMA outputs as a separate srun job step.
+
+        The configuration is handed over as a JSON file (valid YAML for ConfigManager), and the
+        number of tasks is SETTINGS_SUMMA_MERGE_MPI_TASKS, or the srun default if it is 'default'.
+
+        Returns:
+            bool: True if the merge job step succeeded, False if srun is unavailable or failed and
+            the caller should merge in this process instead.
+        """
+        if shutil.which('srun') is None:
+            self.logger.warning("srun not found, merging SUMMA outputs in this process")
+            return False
+
+        config_file = self.project_dir / 'summa_merge_config.json'
+        config_file.write_text(json.dumps(self.config, indent=2, default=str))
+
+        cmd = ['srun']
+        ntasks = self.config.get('SETTINGS_SUMMA_MERGE_MPI_TASKS', 'default')
+        if ntasks not in (None, 'default'):
+            cmd += ['-n', str(ntasks)]
+        cmd += [sys.executable, '-m', 'utils.models_utils.summa_utils', 'merge', str(config_file)]
+
+        self.logger.info(f"Merging SUMMA outputs with MPI: {' '.join(cmd)}")
+        try:
+            subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=Path(__file__).resolve().parents[2])
+        except (OSError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, 'stderr', None) or str(e)
+            self.logger.warning(f"MPI merge failed, merging SUMMA outputs in this process: {stderr}")
+            return False
+        return True
+
+    def _merge_with_mpi(self, input_files: list[Path], output_file: Path) -> bool:
+        """
+        Merge per-GRU SUMMA outputs with a parallel (MPI-IO) netCDF write.
+
+        Every MPI rank reads a contiguous block of the input files and writes its GRU/HRU slab of
+        the output file. Requires the merge to be launched under MPI without submitting SUMMA again,
+        i.e. through this module's merge entry point (srun python -m utils.models_utils.summa_utils
+        merge <config>), mpi4py and a netCDF4/HDF5 build with parallel support.
+
+        Args:
+            input_files (list[Path]): Per-GRU SUMMA output files in GRU order.
+            output_file (Path): Merged output file.
+
+        Returns:
+            bool: True if the merged file was written, False if the MPI path is unavailable and the
+            caller should fall back to the serial merge.
+        """
+        comm, rank, size = self._mpi_comm()
+        if comm is None:
+            if rank == 0:
+                self.logger.warning("mpi4py is not available, falling back to the serial merge")
+            return False
+        from mpi4py import MPI # type: ignore
+
+        if size == 1 or not getattr(nc4, '__has_parallel4_support__', False):
+            if rank == 0:
+                self.logger.warning("Not running under MPI with parallel netCDF4 support, falling back to the serial merge")
+            return False
+
+        # Contiguous block of files per rank, so each rank writes a single slab per variable
+        my_files = np.array_split(np.asarray(input_files, dtype=object), size)[rank]
+
+        # GRU/HRU counts of every rank's files give the slab offsets and output dimension sizes
+        all_sizes = comm.allgather([self._gru_hru_sizes(f) for f in my_files])
+        rank_grus = [sum(g for g, _ in sizes) for sizes in all_sizes]
+        rank_hrus = [sum(h for _, h in sizes) for sizes in all_sizes]
+        starts = {'gru': sum(rank_grus[:rank]), 'hru': sum(rank_hrus[:rank])}
+
+        with xr.open_dataset(input_files[0]) as first:
+            seconds_since_ref = self._seconds_since_1990(first.time.values)
+
+        with nc4.Dataset(input_files[0]) as template, \
+             nc4.Dataset(output_file, 'w', parallel=True, comm=comm, info=MPI.Info(), format='NETCDF4') as out:
+            template.set_auto_maskandscale(False)
+
+            # Define the output layout collectively; time is fixed-length as parallel writes cannot extend it independently
+            self._define_merged_output(template, out, {'time': len(seconds_since_ref), 'gru': sum(rank_grus), 'hru': sum(rank_hrus)})
+            out.set_auto_maskandscale(False)
+
+            # Variables on neither gru nor hru are the same in every file and written once
+            if rank == 0:
+                out['time'][:] = seconds_since_ref
+                for name, var in template.variables.items():
+                    if name != 'time' and not {'gru', 'hru'} & set(var.dimensions):
+                        out[name][:] = var[:]
+
+            # Each rank writes the slab of gru and hru variables covered by its files
+            sources = [nc4.Dataset(f) for f in my_files]
+            try:
+                for src in sources:
+                    src.set_auto_maskandscale(False)
+                for name, out_var in out.variables.items():
+                    dims = out_var.dimensions
+                    split_dim = 'gru' if 'gru' in dims else 'hru' if 'hru' in dims else None
+                    if split_dim is None or not sources:
+                        continue
+                    axis = dims.index(split_dim)
+                    slab = np.concatenate([src[name][:] for src in sources], axis=axis)
+                    index = [slice(None)] * len(dims)
+                    index[axis] = slice(starts[split_dim], starts[split_dim] + slab.shape[axis])
+                    out_var[tuple(index)] = slab
+            finally:
+                for src in sources:
+                    src.close()
+
+        comm.Barrier()
+        if rank == 0:
+            self.logger.info(f"Successfully created merged file with {size} MPI ranks: {output_file}")
+        return True
+
+    def _merge_with_netcdf4(self, input_files: list[Path], output_file: Path):
+        """
+        Merge per-GRU SUMMA outputs by copying raw slabs into a preallocated netCDF4 file.
+
+        The output is defined once with its final gru and hru sizes, then the input files are read
+        with netCDF4 in parallel worker processes and each gru/hru variable is written whole at the
+        file's offset, without decoding. Variables are chunked so each chunk holds the full time series of
+        one GRU or HRU.
+
+        Args:
+            input_files (list[Path]): Per-GRU SUMMA output files in GRU order.
+            output_file (Path): Merged output file.
+        """
+        # GRU/HRU counts give each file's offsets along gru and hru
+        sizes = {}
+        for src_file in input_files:
+            try:
+                sizes[src_file] = self._gru_hru_sizes(src_file)
+            except Exception as e:
+                self.logger.error(f"Error processing file {src_file}: {str(e)}")
+        input_files = [f for f in input_files if f in sizes]
+        if not input_files:
+            return
+
+        gru_starts = np.cumsum([0] + [sizes[f][0] for f in input_files])
+        hru_starts = np.cumsum([0] + [sizes[f][1] for f in input_files])
+
+        with xr.open_dataset(input_files[0]) as first:
+            seconds_since_ref = self._seconds_since_1990(first.time.values)
+
+        with nc4.Dataset(input_files[0]) as template, nc4.Dataset(output_file, 'w', format='NETCDF4') as out:
+            template.set_auto_maskandscale(False)
+            self._define_merged_output(template, out, {'time': None, 'gru': int(gru_starts[-1]), 'hru': int(hru_starts[-1])}, chunked=True)
+            if 'summaVersion' not in out.ncattrs():
+                out.setncatts({'summaVersion': '', 'buildTime': '', 'gitBranch': '', 'gitHash': ''})
+            out.set_auto_maskandscale(False)
+
+            # Variables on neither gru nor hru are the same in every file and written once
+            out['time'][:] = seconds_since_ref
+            split_axes = {}
+            for name, var in template.variables.items():
+                dims = var.dimensions
+                if 'gru' in dims or 'hru' in dims:
+                    split_dim = 'gru' if 'gru' in dims else 'hru'
+                    split_axes[name] = (split_dim, dims.index(split_dim))
+                elif name != 'time':
+                    out[name][:] = var[:]
+
+        # Read the files in worker processes, as the netCDF-C library is not thread-safe, and write each
+        # file's slab of every gru and hru variable as it arrives; batches bound the slabs held in memory.
+        # Workers are spawned rather than forked, so they do not inherit the parent's open HDF5 state
+        max_workers = min(32, os.cpu_count() or 1)
+        batch_size = 2 * max_workers
+        mp_context = multiprocessing.get_context('spawn')
+        with ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context) as executor, \
+             nc4.Dataset(output_file, 'a') as out:
+            out.set_auto_maskandscale(False)
+            for batch_start in range(0, len(input_files), batch_size):
+                batch = input_files[batch_start:batch_start + batch_size]
+                for i, slabs in enumerate(executor.map(_read_raw_variables, batch, repeat(list(split_axes))), start=batch_start):
+                    starts = {'gru': int(gru_starts[i]), 'hru': int(hru_starts[i])}
+                    for name, slab in slabs.items():
+                        split_dim, axis = split_axes[name]
+                        index = [slice(None)] * slab.ndim
+                        index[axis] = slice(starts[split_dim], starts[split_dim] + slab.shape[axis])
+                        out[name][tuple(index)] = slab
+
+        self.logger.info(f"Successfully created merged file: {output_file}")
+
+    def _gru_hru_sizes(self, path: Path) -> tuple[int, int]:
+        """Return the sizes of the gru and hru dimensions of a per-GRU SUMMA output file."""
+        with nc4.Dataset(path) as nc:
+            return len(nc.dimensions['gru']), len(nc.dimensions['hru'])
+
+    def _define_merged_output(self, template, out, sizes: dict, chunked: bool = False):
+        """
+        Define the dimensions, variables and attributes of a merged output file from one per-GRU output.
+
+        Args:
+            template (nc4.Dataset): Per-GRU SUMMA output file.
+            out (nc4.Dataset): Merged output file, open for writing.
+            sizes (dict): Sizes of the time, gru and hru dimensions in the merged file (None for unlimited).
+            chunked (bool): Chunk and compress the variables so each chunk holds the full time series of one GRU or HRU.
+        """
+        out.setncatts(template.__dict__)
+        for name, dim in template.dimensions.items():
+            out.createDimension(name, sizes[name] if name in sizes else len(dim))
+        for name, var in template.variables.items():
+            fill_value = var.getncattr('_FillValue') if '_FillValue' in var.ncattrs() else None
+            options = {}
+            if chunked and var.dimensions:
+                chunksizes = tuple(1 if d in ('gru', 'hru') else max(1, len(template.dimensions[d])) for d in var.dimensions)
+                options = {'chunksizes': chunksizes, 'zlib': True, 'complevel': 1, 'shuffle': True}
+            out_var = out.createVariable(name, var.dtype, var.dimensions, fill_value=fill_value, **options)
+            out_var.setncatts({k: var.getncattr(k) for k in var.ncattrs() if k != '_FillValue'})
+        out['time'].setncatts(self.MERGED_TIME_ATTRS)
+
+    def _merge_with_nco(self, input_files: list[Path], output_file: Path) -> bool:
+        """
+        Merge per-GRU SUMMA outputs with the NCO command line tools.
+
+        ncrcat only concatenates along the leading record dimension, so the gru (or hru) variables of
+        every file are first permuted with ncpdq to put gru (or hru) first, which also makes it the
+        record dimension. The permuted files are concatenated with ncrcat, permuted back to time-first,
+        and appended to the variables on neither dimension taken from the first file. The result is
+        checked against the expected dimensions before it replaces the output file, and its time axis
+        is converted to seconds since 1990 in place.
+
+        Args:
+            input_files (list[Path]): Per-GRU SUMMA output files in GRU order.
+            output_file (Path): Merged output file.
+
+        Returns:
+            bool: True if the merged file was written, False if NCO is unavailable, failed or produced
+            an unexpected layout and the caller should fall back to the xarray merge.
+        """
+        if any(shutil.which(tool) is None for tool in ('ncks', 'ncpdq', 'ncrcat')):
+            self.logger.warning("NCO (ncks, ncpdq, ncrcat) not found, falling back to the xarray merge")
+            return False
+
+        # Same split of variables as the xarray merge, and the dimensions the merged file must have
+        with nc4.Dataset(input_files[0]) as first:
+            gru_vars = [n for n, v in first.variables.items() if 'gru' in v.dimensions]
+            hru_vars = [n for n, v in first.variables.items() if 'hru' in v.dimensions and 'gru' not in v.dimensions]
+            other_vars = [n for n in first.variables if n not in gru_vars and n not in hru_vars]
+            expected_dims = {n: v.dimensions for n, v in first.variables.items()}
+            expected_sizes = {name: len(dim) for name, dim in first.dimensions.items()}
+        sizes = [self._gru_hru_sizes(f) for f in input_files]
+        expected_sizes.update({'gru': sum(g for g, _ in sizes), 'hru': sum(h for _, h in sizes)})
+
+        def nco(*args):
+            subprocess.run([str(a) for a in args], check=True, capture_output=True, text=True)
+
+        try:
+            with tempfile.TemporaryDirectory(dir=output_file.parent) as tmp:
+                tmp_path = Path(tmp)
+                merged = tmp_path / 'merged.nc'
+                nco('ncks', '-O', '-4', '-h', '-C', '-v', ','.join(other_vars), input_files[0], merged)
+
+                for dim, names in (('gru', gru_vars), ('hru', hru_vars)):
+                    if not names:
+                        continue
+
+                    def to_leading(i_src):
+                        i, src = i_src
+                        dst = tmp_path / f"{dim}_{i:06d}.nc"
+                        nco('ncpdq', '-O', '-4', '-h', '-C', '-v', ','.join(names), '-a', f"{dim},time", src, dst)
+                        return dst
+
+                    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+                        parts = list(executor.map(to_leading, enumerate(input_files)))
+                    concatenated = tmp_path / f"{dim}_all.nc"
+                    nco('ncrcat', '-O', '-4', '-h', *parts, concatenated)
+                    for part in parts:
+                        part.unlink()
+
+                    # Back to time-first, with time as the record dimension
+                    restored = tmp_path / f"{dim}_restored.nc"
+                    nco('ncpdq', '-O', '-4', '-h', '-a', f"time,{dim}", concatenated, restored)
+                    nco('ncks', '-A', '-h', restored, merged)
+
+                final = tmp_path / 'final.nc'
+                nco('ncks', '-O', '-4', '-h', '-L', '1', merged, final)
+
+                with nc4.Dataset(final, 'a') as out:
+                    problems = [f"{name}: {len(out.dimensions[name]) if name in out.dimensions else 'missing'} != {size}"
+                                for name, size in expected_sizes.items()
+                                if name not in out.dimensions or len(out.dimensions[name]) != size]
+                    problems += [f"{name}: {out[name].dimensions if name in out.variables else 'missing'} != {dims}"
+                                 for name, dims in expected_dims.items()
+                                 if name not in out.variables or out[name].dimensions != dims]
+                    if problems:
+                        self.logger.warning(f"NCO merge produced an unexpected layout, falling back to the xarray merge: {'; '.join(problems)}")
+                        return False
+
+                    # Only the time axis changes, so update it in place rather than rewriting the file
+                    time_var = out['time']
+                    time_values = nc4.num2date(time_var[:], time_var.units, calendar=getattr(time_var, 'calendar', 'standard'),
+                                               only_use_cftime_datetimes=False, only_use_python_datetimes=True)
+                    time_var[:] = self._seconds_since_1990(np.array(time_values, dtype='datetime64[s]'))
+                    time_var.setncatts(self.MERGED_TIME_ATTRS)
+                    if 'summaVersion' not in out.ncattrs():
+                        out.setncatts({'summaVersion': '', 'buildTime': '', 'gitBranch': '', 'gitHash': ''})
+
+                os.replace(final, output_file)
+        except (OSError, subprocess.CalledProcessError) as e:
+            stderr = getattr(e, 'stderr', None) or str(e)
+            self.logger.warning(f"NCO merge failed, falling back to the xarray merge: {stderr}")
+            return False
+
+        self.logger.info(f"Successfully created merged file with NCO: {output_file}")
+        return True
+
+    def _open_summa_outputs(self, input_files: list[Path]) -> list[xr.Dataset]:
+        """
+        Open per-GRU SUMMA output files lazily, in parallel.
+
+        The time dimension is unlimited in SUMMA outputs and typically stored in chunks of a single
+        timestep; Dask chunks are sized automatically along time instead, so the merge graph has a
+        few tasks per file rather than one per timestep.
+
+        Args:
+            input_files (list[Path]): SUMMA output files to open.
+
+        Returns:
+            list[xr.Dataset]: Undecoded, Dask-backed datasets in input order. Files that fail to open are logged and skipped.
+        """
+        def open_one(src_file):
+            try:
+                return _open_raw_netcdf(src_file, chunks={'time': 'auto'})
+            except Exception as e:
+                self.logger.error(f"Error processing file {src_file}: {str(e)}")
+                return None
+
+        opened = dask.compute(*[dask.delayed(open_one)(f) for f in input_files], scheduler='threads')
+        return [ds for ds in opened if ds is not None]
+
+    def _choose_chunks(self, shape: tuple, dims: tuple, itemsize: int, target_bytes: int = 10 * 1024 * 1024) -> tuple:
+        """
+        Choose netCDF chunk sizes for a variable, keeping the whole time dimension in one chunk where possible.
+
+        Non-time dimensions are halved, largest first, until a chunk fits in target_bytes; the time
+        dimension is only reduced if the chunk is still too large with every other dimension at 1.
+
+        Args:
+            shape (tuple): Variable shape.
+            dims (tuple): Variable dimension names.
+            itemsize (int): Bytes per element.
+            target_bytes (int): Upper bound on the size of one chunk.
+
+        Returns:
+            tuple: Chunk size per dimension.
+        """
+        chunks = [max(1, int(n)) for n in shape]
+        time_idx = dims.index('time') if 'time' in dims else None
+        others = [i for i in range(len(chunks)) if i != time_idx]
+
+        while int(np.prod(chunks)) * itemsize > target_bytes:
+            largest = max(others, key=lambda i: chunks[i], default=None)
+            if largest is not None and chunks[largest] > 1:
+                chunks[largest] = -(-chunks[largest] // 2)
+            elif time_idx is not None and chunks[time_idx] > 1:
+                chunks[time_idx] = -(-chunks[time_idx] // 2)
+            else:
+                break
+
+        return tuple(chunks)
+
+    def _combine_summa_outputs(self, datasets: list[xr.Dataset]) -> xr.Dataset:
+        """
+        Combine per-GRU SUMMA outputs into one dataset with a single concatenation per dimension.
+
+        Variables on the gru dimension are concatenated along gru, variables on the hru dimension
+        along hru, and variables on neither (e.g. time) are taken from the first file.
+
+        Args:
+            datasets (list[xr.Dataset]): Per-GRU datasets in GRU order.
+
+        Returns:
+            xr.Dataset: Combined dataset with the global attributes of the first file.
+        """
+        first = datasets[0]
+        gru_vars = [v for v in first.data_vars if 'gru' in first[v].dims]
+        hru_vars = [v for v in first.data_vars if 'hru' in first[v].dims and 'gru' not in first[v].dims]
+        other_vars = [v for v in first.data_vars if v not in gru_vars and v not in hru_vars]
+
+        # All files share the same time axis and variables, so skip coordinate comparison and alignment
+        concat_kwargs = {'data_vars': 'minimal', 'coords': 'minimal', 'compat': 'override', 'join': 'override'}
+
+        parts = [first[other_vars]]
+        if gru_vars:
+            parts.append(xr.concat([ds[gru_vars] for ds in datasets], dim='gru', **concat_kwargs))
+        if hru_vars:
+            parts.append(xr.concat([ds[hru_vars] for ds in datasets], dim='hru', **concat_kwargs))
+
+        return xr.merge(parts, combine_attrs='override')
+
+
+def main():
+    """
+    Merge the outputs of a parallel SUMMA run with MPI, without submitting any jobs.
+
+    Run from the repository root under MPI, e.g.:
+        srun -n 16 python -m utils.models_utils.summa_utils merge <config.yaml>
+    """
+    if len(sys.argv) != 3 or sys.argv[1] != 'merge':
+        print("Usage: python -m utils.models_utils.summa_utils merge <config_file>")
+        sys.exit(1)
+
+    from utils.configHandling_utils.config_utils import ConfigManager # type: ignore
+    config = ConfigManager(sys.argv[2]).config
+    config['SETTINGS_SUMMA_PARALLEL_MERGE'] = 'mpi'
+
+    runner = SummaRunner(config, logging.getLogger('summa_merge'))
+
+    # Only rank 0 reports progress; the other ranks log warnings and errors only
+    _, rank, _ = runner._mpi_comm()
+    logging.basicConfig(level=logging.INFO if rank == 0 else logging.WARNING,
+                        format=f'%(asctime)s rank {rank} %(levelname)s %(message)s')
+    runner.merge_parallel_outputs()
+
+
+if __name__ == "__main__":
+    main()